@@ -0,0 +1,101 @@
+"""Per-play hashing cost: stock manim hashing vs IncrementalHashScene.
+
+Replays a scene with rendering skipped and, on every play, times both hash
+functions against the same scene state. Stock hashing grows with the number
+of mobjects on screen; the incremental hash should stay flat. The run exits
+non-zero if incremental ms/play in the largest third of the scene is more
+than ``FLAT_TOLERANCE`` times that in the smallest third.
+
+    python benchmarks/bench_scene_hashing.py [SceneName]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils import hashing
+
+import main_plexus
+
+# Incremental ms/play may grow by at most this factor from the smallest to the
+# largest third of the scene (by family size) before the run counts as a failure
+FLAT_TOLERANCE = 2.0
+
+
+class HashTimingRenderer(CairoRenderer):
+    def __init__(self):
+        super().__init__(skip_animations=True)
+        self.samples = []
+
+    def play(self, scene, *args, **kwargs):
+        scene.compile_animation_data(*args, **kwargs)
+        family = len(scene.get_mobject_family_members())
+
+        start = perf_counter()
+        hashing.get_hash_from_play_call(scene, self.camera, scene.animations, scene.mobjects)
+        stock_time = perf_counter() - start
+
+        start = perf_counter()
+        scene.get_play_hash(self.camera, scene.animations, scene.mobjects)
+        incremental_time = perf_counter() - start
+
+        self.samples.append((self.num_plays, family, stock_time, incremental_time))
+        super().play(scene, *scene.animations)
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def slope(xs, ys):
+    # Least-squares slope of ys against xs
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0.0
+
+
+def main():
+    scene_name = sys.argv[1] if len(sys.argv) > 1 else "BrachialPlexusConstruction"
+    scene_cls = getattr(main_plexus, scene_name)
+
+    with tempconfig({"dry_run": True, "progress_bar": "none", "disable_caching_warning": True}):
+        renderer = HashTimingRenderer()
+        scene_cls(renderer=renderer).render()
+
+    print(f"{'play':>4} {'family':>7} {'stock ms':>9} {'incr ms':>8}")
+    for index, family, stock_time, incremental_time in renderer.samples:
+        print(f"{index:>4} {family:>7} {stock_time * 1000:>9.2f} {incremental_time * 1000:>8.2f}")
+
+    # Median ms/play over the plays with the smallest, middle and largest scenes
+    samples = sorted(renderer.samples, key=lambda s: s[1])
+    third = max(1, len(samples) // 3)
+    groups = [samples[:third], samples[third:-third] or samples, samples[-third:]]
+    print()
+    print(f"{'family':>13} {'stock ms':>9} {'incr ms':>8}")
+    for group in groups:
+        span = f"{group[0][1]}-{group[-1][1]}"
+        stock = median([s[2] for s in group]) * 1000
+        incremental = median([s[3] for s in group]) * 1000
+        print(f"{span:>13} {stock:>9.2f} {incremental:>8.2f}")
+
+    families = [s[1] / 1000 for s in renderer.samples]
+    print()
+    print(f"growth per 1000 family members: stock {slope(families, [s[2] * 1000 for s in renderer.samples]):.2f} ms/play, "
+          f"incremental {slope(families, [s[3] * 1000 for s in renderer.samples]):.2f} ms/play")
+    print(f"total: stock {sum(s[2] for s in renderer.samples):.3f}s, incremental {sum(s[3] for s in renderer.samples):.3f}s")
+
+    smallest = median([s[3] for s in groups[0]])
+    largest = median([s[3] for s in groups[-1]])
+    if largest > FLAT_TOLERANCE * smallest:
+        print(f"incremental hashing grows with the scene: {smallest * 1000:.2f} -> {largest * 1000:.2f} ms/play")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
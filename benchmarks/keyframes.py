@@ -0,0 +1,143 @@
+"""Keyframe snapshot regression check for the lecture scenes.
+
+Runs each scene on the skip-to-state path (plays are applied, never
+rasterised) and captures only the named ``self.keyframe(...)`` checkpoints,
+at low resolution. Each capture is reduced to a colour signature: a 64x36 RGB
+thumbnail, one cell per 7.5x7.5 px block. It is compared with the golden in
+``benchmarks/keyframes.json`` by counting the cells where any channel moved
+by more than ``LEVEL_TOLERANCE``. The run prints how long each keyframe took
+to reach and to capture.
+
+    python benchmarks/keyframes.py                  # check every scene
+    python benchmarks/keyframes.py ErbsPalsyScene   # check one scene
+    python benchmarks/keyframes.py --update         # accept the current pictures as golden
+    python benchmarks/keyframes.py --save media/keyframes   # also write the PNGs
+"""
+
+import argparse
+import base64
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+import main_plexus
+from cost_estimator import scene_names
+
+GOLDENS_PATH = Path(__file__).resolve().parent / "keyframes.json"
+PIXEL_HEIGHT, PIXEL_WIDTH = 270, 480
+# (columns, rows) of the signature thumbnail. Cells are small enough that
+# recolouring a 1-2 px stroke, or a 10 pt label, moves a cell's average by
+# about 20 levels or more
+SIGNATURE_GRID = (64, 36)
+# Per-channel change (of 255) still treated as the same cell; absorbs antialiasing noise
+LEVEL_TOLERANCE = 16
+# Changed cells still treated as the same picture
+CELL_TOLERANCE = 3
+
+
+def signature(image):
+    # Box-filtered colour thumbnail. A difference hash only records which
+    # neighbour is brighter, so recolouring a thin stroke on a flat
+    # background keeps every bit; averaged colours change instead
+    pixels = np.asarray(image.convert("RGB").resize(SIGNATURE_GRID, Image.BOX), dtype=np.uint8)
+    return base64.b64encode(pixels.tobytes()).decode("ascii")
+
+
+def distance(a, b):
+    # Number of thumbnail cells whose colour moved by more than LEVEL_TOLERANCE
+    shape = (SIGNATURE_GRID[1], SIGNATURE_GRID[0], 3)
+    a = np.frombuffer(base64.b64decode(a), dtype=np.uint8).reshape(shape).astype(np.int16)
+    b = np.frombuffer(base64.b64decode(b), dtype=np.uint8).reshape(shape).astype(np.int16)
+    return int((np.abs(a - b).max(axis=2) > LEVEL_TOLERANCE).sum())
+
+
+class KeyframeCapture:
+    # Mixed in ahead of a scene class by capture()
+
+    def setup(self):
+        super().setup()
+        self.keyframes = []
+        self.last_keyframe = perf_counter()
+
+    def keyframe(self, name):
+        reached = perf_counter()
+        self.renderer.static_image = None
+        self.renderer.update_frame(self, ignore_skipping=True)
+        image = self.renderer.camera.get_image()
+        captured = perf_counter()
+        self.keyframes.append({
+            "name": name,
+            "image": image,
+            "signature": signature(image),
+            "advance": reached - self.last_keyframe,
+            "capture": captured - reached,
+        })
+        self.last_keyframe = perf_counter()
+
+
+def capture(scene_name, mixins=()):
+    base_cls = getattr(main_plexus, scene_name)
+    scene_cls = type(scene_name, (KeyframeCapture, *mixins, base_cls), {})
+    options = {
+        "dry_run": True,
+        "pixel_height": PIXEL_HEIGHT,
+        "pixel_width": PIXEL_WIDTH,
+        "progress_bar": "none",
+        "input_file": main_plexus.__file__,
+    }
+    with tempconfig(options):
+        scene = scene_cls(renderer=CairoRenderer(skip_animations=True))
+        scene.render()
+    return scene.keyframes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check scene keyframes against stored colour signatures")
+    parser.add_argument("scenes", nargs="*")
+    parser.add_argument("--update", action="store_true", help="store the current keyframes as goldens")
+    parser.add_argument("--save", type=Path, help="directory to write keyframe PNGs to")
+    args = parser.parse_args()
+
+    goldens = json.loads(GOLDENS_PATH.read_text()) if GOLDENS_PATH.exists() else {}
+    failures = 0
+    total = perf_counter()
+
+    print(f"{'keyframe':<42} {'reach ms':>9} {'capture ms':>10} {'cells':>5}  status")
+    for scene_name in args.scenes or scene_names(main_plexus):
+        for frame in capture(scene_name):
+            key = f"{scene_name}:{frame['name']}"
+            if args.save:
+                args.save.mkdir(parents=True, exist_ok=True)
+                frame["image"].save(args.save / f"{scene_name}_{frame['name']}.png")
+
+            golden = goldens.get(key)
+            if args.update:
+                goldens[key] = frame["signature"]
+                dist, status = 0, "updated"
+            elif golden is None:
+                dist, status = "-", "NO GOLDEN"
+                failures += 1
+            else:
+                dist = distance(golden, frame["signature"])
+                status = "ok" if dist <= CELL_TOLERANCE else "CHANGED"
+                failures += dist > CELL_TOLERANCE
+            print(f"{key:<42} {frame['advance'] * 1000:>9.1f} {frame['capture'] * 1000:>10.1f} {dist:>5}  {status}")
+
+    if args.update:
+        GOLDENS_PATH.write_text(json.dumps(dict(sorted(goldens.items())), indent=2) + "\n")
+    print(f"\n{perf_counter() - total:.2f}s total, {failures} failing")
+    if not goldens:
+        print(f"no goldens in {GOLDENS_PATH}; record them with --update on a known-good tree")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
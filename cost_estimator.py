@@ -0,0 +1,263 @@
+"""Static render-cost estimate for a scene, without rendering it.
+
+Runs a scene's construct() with every play skipped (no rasterisation, no
+ffmpeg) and records the play/wait timeline: frames at the target quality,
+mobject and point counts per play, text objects built, and lagged groups.
+A linear cost model turns that into predicted wall time. The default
+coefficients are order-of-magnitude guesses, not measurements; fit them to
+real render times with ``calibrate``.
+
+    python cost_estimator.py report main_plexus -q h
+    python cost_estimator.py report main_plexus --workers 3 --json
+    python cost_estimator.py calibrate [timings.jsonl]
+
+The timings log has one measured render per line, and the render daemon
+appends to it (``render_options.TIMINGS_PATH``) after every uncached render:
+``{"module": "main_plexus", "scene": "ErbsPalsyScene", "quality": "l", "seconds": 41.2}``
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import sys
+
+import numpy as np
+from manim import AnimationGroup, MarkupText, Paragraph, SingleStringMathTex, Text, Wait, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from scipy.optimize import nnls
+
+from render_options import QUALITY_FLAGS, TIMINGS_PATH
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "cost_model.json")
+
+TEXT_TYPES = (Text, MarkupText, Paragraph, SingleStringMathTex)
+
+# Feature order shared by estimate() and calibrate()
+FEATURES = ("scene", "frame_megapixels", "moving_kilopoint_frames", "static_frame_megapixels", "texts")
+DEFAULT_MODEL = {
+    "scene": 1.5,                     # construct(), setup, combining partial files
+    "frame_megapixels": 0.012,        # rasterise + encode one animated frame, per megapixel
+    "moving_kilopoint_frames": 0.0004,  # Cairo path work for moving mobjects, per 1000 points per frame
+    "static_frame_megapixels": 0.002,   # encode a repeated frozen frame, per megapixel
+    "texts": 0.08,                    # Pango layout + SVG parse per Text/Tex object
+}
+
+# Review flags
+WIDE_GROUP = 8
+LONG_WAIT = 3.0
+EXPENSIVE_SHARE = 0.1
+
+
+def group_width(animation):
+    if isinstance(animation, AnimationGroup):
+        return max([len(animation.animations)] + [group_width(sub) for sub in animation.animations])
+    return 1
+
+
+def family_points(mobjects):
+    return sum(len(member.points) for mobject in mobjects for member in mobject.get_family())
+
+
+class CostRecordingRenderer(CairoRenderer):
+    def __init__(self):
+        super().__init__(skip_animations=True)
+        self.plays = []
+        self.seen_texts = set()
+
+    def play(self, scene, *args, **kwargs):
+        scene.compile_animation_data(*args, **kwargs)
+        animations = scene.animations
+        family = scene.get_mobject_family_members()
+        frozen = len(animations) == 1 and isinstance(animations[0], Wait) and bool(animations[0].is_static_wait)
+
+        texts = {id(m) for m in family if isinstance(m, TEXT_TYPES)}
+        for animation in animations:
+            if animation.mobject is not None:
+                texts.update(id(m) for m in animation.mobject.get_family() if isinstance(m, TEXT_TYPES))
+        new_texts = len(texts - self.seen_texts)
+        self.seen_texts |= texts
+
+        dt = 1 / config["frame_rate"]
+        self.plays.append({
+            "index": self.num_plays,
+            "kind": "wait" if isinstance(animations[0], Wait) and len(animations) == 1 else "play",
+            "label": ", ".join(str(animation) for animation in animations),
+            "duration": float(scene.duration),
+            "frames": int(scene.duration / dt) if frozen else math.ceil(scene.duration / dt),
+            "frozen": frozen,
+            "mobjects": len(family),
+            "points": sum(len(m.points) for m in family),
+            "moving_points": 0 if frozen else family_points([a.mobject for a in animations if a.mobject is not None]),
+            "new_texts": new_texts,
+            "group_width": max(group_width(animation) for animation in animations),
+        })
+        super().play(scene, *animations)
+
+
+def load_model(path=MODEL_PATH):
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return dict(DEFAULT_MODEL)
+
+
+def play_features(play, megapixels):
+    frames = play["frames"]
+    if play["frozen"]:
+        return {"frame_megapixels": 0.0, "moving_kilopoint_frames": 0.0,
+                "static_frame_megapixels": frames * megapixels, "texts": play["new_texts"]}
+    return {"frame_megapixels": frames * megapixels, "moving_kilopoint_frames": frames * play["moving_points"] / 1000,
+            "static_frame_megapixels": 0.0, "texts": play["new_texts"]}
+
+
+def play_cost(play, megapixels, model):
+    features = play_features(play, megapixels)
+    return sum(model[name] * value for name, value in features.items())
+
+
+def record_timeline(module, scene_name, quality):
+    scene_cls = getattr(module, scene_name)
+    options = {
+        "dry_run": True,
+        "quality": QUALITY_FLAGS.get(quality, quality),
+        "progress_bar": "none",
+        "input_file": module.__file__,
+    }
+    with tempconfig(options):
+        renderer = CostRecordingRenderer()
+        scene_cls(renderer=renderer).render()
+        megapixels = config["pixel_width"] * config["pixel_height"] / 1e6
+        frame_rate = config["frame_rate"]
+    return renderer.plays, megapixels, frame_rate
+
+
+def estimate(module, scene_name, quality="l", model=None):
+    model = model or load_model()
+    plays, megapixels, frame_rate = record_timeline(module, scene_name, quality)
+
+    for play in plays:
+        play["seconds"] = round(play_cost(play, megapixels, model), 3)
+    seconds = model["scene"] + sum(play["seconds"] for play in plays)
+
+    flags = []
+    for play in plays:
+        if play["group_width"] >= WIDE_GROUP:
+            flags.append(f"play {play['index']}: {play['group_width']}-way animation group ({play['label'][:60]})")
+        if play["kind"] == "wait" and play["duration"] >= LONG_WAIT:
+            flags.append(f"play {play['index']}: {play['duration']:g}s wait")
+        if play["seconds"] >= EXPENSIVE_SHARE * seconds:
+            flags.append(f"play {play['index']}: ~{play['seconds']:.1f}s, {play['seconds'] / seconds:.0%} of the scene")
+
+    return {
+        "scene": scene_name,
+        "quality": quality,
+        "frame_rate": frame_rate,
+        "megapixels": megapixels,
+        "plays": plays,
+        "duration": round(sum(play["duration"] for play in plays), 3),
+        "frames": sum(play["frames"] for play in plays),
+        "texts": sum(play["new_texts"] for play in plays),
+        "max_points": max((play["points"] for play in plays), default=0),
+        "seconds": round(seconds, 3),
+        "flags": flags,
+    }
+
+
+def pack(estimates, workers):
+    # Longest-processing-time first: biggest scene goes to the least loaded worker
+    bins = [{"seconds": 0.0, "scenes": []} for _ in range(workers)]
+    for item in sorted(estimates, key=lambda e: e["seconds"], reverse=True):
+        target = min(bins, key=lambda b: b["seconds"])
+        target["scenes"].append(item["scene"])
+        target["seconds"] = round(target["seconds"] + item["seconds"], 3)
+    return bins
+
+
+def scene_names(module):
+    from manim import Scene
+
+    return [
+        name for name, value in vars(module).items()
+        if isinstance(value, type) and issubclass(value, Scene)
+        and value.__module__ == module.__name__ and "construct" in vars(value)
+    ]
+
+
+def calibrate(records_path=TIMINGS_PATH, model_path=MODEL_PATH):
+    rows, targets = [], []
+    with open(records_path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if len(records) < len(FEATURES):
+        raise ValueError(
+            f"{len(records)} timings in {records_path}; fitting {len(FEATURES)} coefficients needs at least as many"
+        )
+    for record in records:
+        module = importlib.import_module(record["module"])
+        plays, megapixels, _ = record_timeline(module, record["scene"], record.get("quality", "l"))
+        totals = dict.fromkeys(FEATURES, 0.0)
+        totals["scene"] = 1.0
+        for play in plays:
+            for name, value in play_features(play, megapixels).items():
+                totals[name] += value
+        rows.append([totals[name] for name in FEATURES])
+        targets.append(record["seconds"])
+
+    # Costs can't be negative; constraining the fit keeps the other coefficients consistent
+    coefficients, _ = nnls(np.array(rows), np.array(targets))
+    model = {name: float(value) for name, value in zip(FEATURES, coefficients)}
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    with open(model_path, "w") as f:
+        json.dump(model, f, indent=2)
+    return model
+
+
+def print_report(report):
+    print(f"{report['scene']} @ {report['quality']}: {report['frames']} frames, "
+          f"{report['duration']:g}s of video, {report['texts']} text objects, "
+          f"peak {report['max_points']} points -> ~{report['seconds']:.1f}s")
+    print(f"  {'#':>3} {'kind':<4} {'dur':>5} {'frames':>6} {'mobs':>5} {'points':>7} {'moving':>7} {'texts':>5} {'est s':>6}")
+    for play in report["plays"]:
+        print(f"  {play['index']:>3} {play['kind']:<4} {play['duration']:>5g} {play['frames']:>6} {play['mobjects']:>5} "
+              f"{play['points']:>7} {play['moving_points']:>7} {play['new_texts']:>5} {play['seconds']:>6.2f}")
+    for flag in report["flags"]:
+        print(f"  ! {flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate scene render cost without rendering")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = commands.add_parser("report")
+    report_parser.add_argument("module")
+    report_parser.add_argument("scenes", nargs="*")
+    report_parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_FLAGS))
+    report_parser.add_argument("--workers", type=int)
+    report_parser.add_argument("--json", action="store_true")
+
+    calibrate_parser = commands.add_parser("calibrate")
+    calibrate_parser.add_argument("records", nargs="?", default=TIMINGS_PATH)
+
+    args = parser.parse_args()
+    sys.path.insert(0, os.getcwd())
+    if args.command == "calibrate":
+        print(json.dumps(calibrate(args.records), indent=2))
+        return
+
+    module = importlib.import_module(args.module)
+    reports = [estimate(module, name, args.quality) for name in (args.scenes or scene_names(module))]
+    packing = pack(reports, args.workers) if args.workers else None
+    if args.json:
+        print(json.dumps({"scenes": reports, "packing": packing}, indent=2))
+        return
+    for report in reports:
+        print_report(report)
+        print()
+    if packing:
+        for index, target in enumerate(packing):
+            print(f"worker {index}: ~{target['seconds']:.1f}s  {', '.join(target['scenes'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Pool of encoder processes fed from a ring of shared-memory frame buffers.
+
+The renderer takes a free slot, writes a frame into it and submits it to the
+current segment. Each segment (one partial movie file) is streamed by one
+encoder process into the command it was opened with, and segments are handed
+to the encoders round-robin so neighbouring ones encode at the same time.
+Only needs numpy, so it can be exercised without manim.
+"""
+
+import multiprocessing
+import os
+import queue
+import subprocess
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# How often a blocked renderer checks that the encoder processes are still alive
+POLL_SECONDS = 1.0
+
+
+def _encoder_main(slot_names, frame_nbytes, jobs, free_slots, results):
+    # Children share the parent's resource tracker, so attaching here must not
+    # be undone with unregister(): that would drop the parent's registration
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+
+    process = None
+    error = None
+    while True:
+        message = jobs.get()
+        if message[0] == "open":
+            _, command, tmp_path, path = message
+            try:
+                process = subprocess.Popen(command + [tmp_path], stdin=subprocess.PIPE)
+                error = None
+            except OSError as exc:
+                # Reported on close, once the segment's frames have been drained
+                process, error = None, str(exc)
+        elif message[0] == "frame":
+            _, slot, repeat = message
+            view = slots[slot].buf[:frame_nbytes]
+            try:
+                if process is not None:
+                    for _ in range(repeat):
+                        process.stdin.write(view)
+            except BrokenPipeError:
+                # ffmpeg died; the return code is reported on close
+                pass
+            finally:
+                view.release()
+                free_slots.put(slot)
+        elif message[0] == "close":
+            if process is None:
+                results.put((path, error))
+                continue
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            code = process.wait()
+            if code == 0:
+                os.replace(tmp_path, path)
+            results.put((path, code))
+            process = None
+        else:
+            break
+
+    for slot in slots:
+        slot.close()
+
+
+def _release(workers, slots):
+    # Also runs if the render fails or the pool is dropped without join()
+    for worker in workers:
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+    for slot in slots:
+        try:
+            slot.close()
+        except BufferError:
+            # A frame array still points into the slot; unlinking is what frees it
+            pass
+        try:
+            slot.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class EncoderPool:
+    def __init__(self, frame_shape, encoders, ring_size):
+        context = multiprocessing.get_context()
+        self.frame_shape = frame_shape
+        frame_nbytes = int(np.prod(frame_shape))
+        self.slots = [shared_memory.SharedMemory(create=True, size=frame_nbytes) for _ in range(ring_size)]
+        self.arrays = [np.ndarray(frame_shape, dtype=np.uint8, buffer=slot.buf) for slot in self.slots]
+
+        self.free_slots = context.Queue()
+        for index in range(ring_size):
+            self.free_slots.put(index)
+        self.results = context.Queue()
+        self.jobs = [context.Queue() for _ in range(encoders)]
+        self.workers = [
+            context.Process(
+                target=_encoder_main,
+                args=([slot.name for slot in self.slots], frame_nbytes, jobs, self.free_slots, self.results),
+                daemon=True,
+            )
+            for jobs in self.jobs
+        ]
+        self.release = weakref.finalize(self, _release, self.workers, self.slots)
+        for worker in self.workers:
+            worker.start()
+        self.segments = 0
+        self.current = None
+
+    def check_workers(self):
+        dead = [worker for worker in self.workers if not worker.is_alive()]
+        if dead:
+            codes = ", ".join(str(worker.exitcode) for worker in dead)
+            raise RuntimeError(f"{len(dead)} of {len(self.workers)} encoder processes died (exit codes {codes})")
+
+    def open_segment(self, command, path):
+        # Round-robin: segment n goes to encoder n % encoders, frames of one
+        # segment stay in order on that encoder's queue
+        self.current = self.jobs[self.segments % len(self.jobs)]
+        root, ext = os.path.splitext(path)
+        # Unique temporary name: the same hash can be queued twice in one scene
+        self.current.put(("open", command, f"{root}.{self.segments}.part{ext}", path))
+        self.segments += 1
+
+    def acquire(self):
+        # Blocks while every slot is queued for encoding (backpressure)
+        while True:
+            try:
+                return self.free_slots.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                self.check_workers()
+
+    def submit(self, slot, repeat=1):
+        self.current.put(("frame", slot, repeat))
+
+    def close_segment(self):
+        self.current.put(("close",))
+        self.current = None
+
+    def next_result(self):
+        while True:
+            try:
+                return self.results.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                # Workers only exit after "stop"; a crash or every worker gone
+                # with segments still unreported means the results never come
+                crashed = any(worker.exitcode not in (None, 0) for worker in self.workers)
+                if crashed or not any(worker.is_alive() for worker in self.workers):
+                    try:
+                        # A worker flushes its results before it exits
+                        return self.results.get(timeout=POLL_SECONDS)
+                    except queue.Empty:
+                        self.check_workers()
+
+    def join(self):
+        try:
+            for jobs in self.jobs:
+                jobs.put(("stop",))
+            failed = []
+            for _ in range(self.segments):
+                path, code = self.next_result()
+                if code != 0:
+                    failed.append(f"{path} ({code})")
+            for worker in self.workers:
+                worker.join()
+        finally:
+            self.arrays = []
+            self.release()
+        if failed:
+            raise RuntimeError(f"ffmpeg failed to encode: {', '.join(failed)}")
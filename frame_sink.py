@@ -0,0 +1,135 @@
+"""Shared-memory frame sink with parallel partial-movie encoding.
+
+The stock Cairo pipeline copies each frame out of the camera
+(``np.array(pixel_array)``), turns it into bytes and pushes it down a single
+ffmpeg pipe, so one encoder at a time works on the whole scene. Here the
+camera rasterises straight into a ring of shared-memory frame buffers. A pool
+of encoder processes streams those buffers into ffmpeg, one process per
+partial movie file, so neighbouring plays encode at the same time. When every
+slot in the ring is waiting to be encoded, the renderer blocks until a slot
+frees up.
+
+Enabled by setting ``PLEXUS_ENCODERS`` (number of encoder processes);
+``PLEXUS_FRAME_RING`` overrides the number of frame slots. Hooks into the
+ffmpeg pipe of manim 0.18's ``SceneFileWriter``; 0.19 replaced it with PyAV,
+hence the pin in requirements.txt.
+"""
+
+import os
+
+from manim import __version__, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+from encoder_pool import EncoderPool
+
+
+class SharedMemoryFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.encoders = int(os.environ.get("PLEXUS_ENCODERS") or max(1, (os.cpu_count() or 2) // 2))
+        self.ring_size = int(os.environ.get("PLEXUS_FRAME_RING") or 2 * self.encoders + 2)
+        self.pool = None
+        self.streaming = False
+
+    def encoder_command(self):
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        return [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", "%dx%d" % (config["pixel_width"], config["pixel_height"]),
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+            "-vcodec", "libx264",
+            "-pix_fmt", "yuv420p",
+        ]
+
+    def open_movie_pipe(self, file_path=None):
+        # webm and transparent .mov keep the stock single-pipe path
+        if is_webm_format() or config["transparent"]:
+            return super().open_movie_pipe(file_path=file_path)
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        if self.pool is None:
+            frame_shape = (config["pixel_height"], config["pixel_width"], 4)
+            self.pool = EncoderPool(frame_shape, self.encoders, self.ring_size)
+        self.pool.open_segment(self.encoder_command(), str(file_path))
+        self.streaming = True
+
+    def close_movie_pipe(self):
+        if not self.streaming:
+            return super().close_movie_pipe()
+        self.pool.close_segment()
+        self.streaming = False
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file queued for encoding in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def acquire_frame(self):
+        slot = self.pool.acquire()
+        return slot, self.pool.arrays[slot]
+
+    def submit_frame(self, slot, num_frames=1):
+        self.pool.submit(slot, num_frames)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not self.streaming:
+            for _ in range(num_frames):
+                super().write_frame(frame_or_renderer)
+            return
+        slot, array = self.acquire_frame()
+        array[...] = frame_or_renderer
+        self.submit_frame(slot, num_frames)
+
+    def finish(self):
+        # Every partial file has to be on disk before they are concatenated
+        if self.pool is not None:
+            self.pool.join()
+            self.pool = None
+        super().finish()
+
+
+class SharedMemoryRenderer(CairoRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(file_writer_class=SharedMemoryFileWriter, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        writer = self.file_writer
+        if self.skip_animations or not writer.streaming:
+            return super().render(scene, time, moving_mobjects)
+        # Point the camera at a free ring slot so Cairo draws straight into
+        # shared memory, then hand the slot to the encoder untouched
+        own_pixel_array = self.camera.pixel_array
+        slot, array = writer.acquire_frame()
+        self.camera.pixel_array = array
+        try:
+            self.update_frame(scene, moving_mobjects)
+        finally:
+            self.camera.pixel_array = own_pixel_array
+        self.time += 1 / self.camera.frame_rate
+        writer.submit_frame(slot)
+
+    def add_frame(self, frame, num_frames=1):
+        # One slot for a whole frozen frame instead of one per repeated frame
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        self.file_writer.write_frame(frame, num_frames)
+
+
+def renderer_from_env(**kwargs):
+    if not os.environ.get("PLEXUS_ENCODERS") or not write_to_movie():
+        return None
+    if not hasattr(SceneFileWriter, "open_movie_pipe"):
+        raise RuntimeError(f"PLEXUS_ENCODERS needs manim 0.18 (found {__version__})")
+    return SharedMemoryRenderer(**kwargs)
@@ -0,0 +1,192 @@
+"""Render a scene in several locales, sharing every segment without text.
+
+Each play is classified by what it animates:
+
+* text-bearing plays (``Write(label)``, ``FadeIn(result_box)``, ...) render
+  in full, once per locale, as usual;
+* every other play (graph creation, colour sweeps, waits) renders a *base*
+  layer with all text hidden. Its partial movie is named after a hash of the
+  non-text mobjects only, so every locale after the first finds it in the
+  cache. The text on screen during such a play is static, so it is captured
+  once as a transparent PNG and laid over the base segment with ffmpeg.
+
+Text is composited on top of the base layer, which matches these scenes:
+labels are always drawn after the shapes they annotate.
+
+    python locale_batch.py main_plexus BrachialPlexusConstruction --locales en,de -q h
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from manim import Camera, config, logger, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from cost_estimator import TEXT_TYPES, scene_names
+from locale_catalog import available_locales, get_locale, set_locale
+from render_options import QUALITY_FLAGS
+from scene_hashing import MobjectHashCache
+
+
+def text_family_ids(mobjects):
+    ids = set()
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            if isinstance(member, TEXT_TYPES):
+                ids.update(id(part) for part in member.get_family())
+    return ids
+
+
+class LayerCamera(Camera):
+    hide_text = False
+
+    def get_mobjects_to_display(self, mobjects, *args, **kwargs):
+        displayed = super().get_mobjects_to_display(mobjects, *args, **kwargs)
+        if not self.hide_text:
+            return displayed
+        hidden = text_family_ids(mobjects)
+        return [mobject for mobject in displayed if id(mobject) not in hidden]
+
+
+class LocaleFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        # play index -> text overlay PNG for that play's base segment
+        self.overlays = {}
+        # indices of the plays rendered as a base layer
+        self.base_plays = set()
+        self.cache_hits = 0
+
+    def is_already_cached(self, hash_invocation):
+        cached = super().is_already_cached(hash_invocation)
+        self.cache_hits += cached
+        return cached
+
+    def composite(self, base, overlay):
+        base = Path(base)
+        path = base.with_name(f"{base.stem}_{Path(overlay).stem}{base.suffix}")
+        if path.exists():
+            return str(path)
+        tmp_path = path.with_name(f"{path.stem}.part{path.suffix}")
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-i", str(base),
+            "-i", str(overlay),
+            # Cairo output is premultiplied
+            "-filter_complex", "[0:v][1:v]overlay=alpha=premultiplied",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-vcodec", "libx264",
+            "-pix_fmt", "yuv420p",
+            str(tmp_path),
+        ]
+        subprocess.run(command, check=True)
+        os.replace(tmp_path, path)
+        return str(path)
+
+    def combine_to_movie(self):
+        replaced = {}
+        for index, overlay in self.overlays.items():
+            base = self.partial_movie_files[index]
+            if base is not None:
+                replaced[base] = self.composite(base, overlay)
+        self.partial_movie_files = [replaced.get(path, path) for path in self.partial_movie_files]
+        for section in self.sections:
+            section.partial_movie_files = [replaced.get(path, path) for path in section.partial_movie_files]
+        super().combine_to_movie()
+
+
+class LocaleLayerScene:
+    # Mixed in ahead of a PlexusScene subclass by render_locales()
+
+    def setup(self):
+        super().setup()
+        self.text_hash_cache = MobjectHashCache()
+        self.overlay_camera = None
+
+    def play(self, *args, **kwargs):
+        self.renderer.camera.hide_text = False
+        super().play(*args, **kwargs)
+
+    def get_play_hash(self, camera, animations, mobjects):
+        animated = [animation.mobject for animation in animations if animation.mobject is not None]
+        if text_family_ids(animated):
+            return super().get_play_hash(camera, animations, mobjects)
+
+        camera.hide_text = True
+        self.renderer.file_writer.base_plays.add(self.renderer.num_plays)
+        hidden = text_family_ids(mobjects)
+        base = [m for mobject in mobjects for m in mobject.get_family() if id(m) not in hidden and len(m.points)]
+        texts = list({id(m): m for mobject in mobjects for m in mobject.get_family() if isinstance(m, TEXT_TYPES)}.values())
+        if texts:
+            self.renderer.file_writer.overlays[self.renderer.num_plays] = self.text_overlay(texts)
+        return super().get_play_hash(camera, animations, base)
+
+    def text_overlay(self, texts):
+        text_hash = self.text_hash_cache.mobjects_hash(self, texts)
+        path = self.renderer.file_writer.partial_movie_directory / f"text_{text_hash}.png"
+        if not path.exists():
+            if self.overlay_camera is None:
+                self.overlay_camera = Camera(background_opacity=0)
+            self.overlay_camera.reset()
+            self.overlay_camera.capture_mobjects(texts)
+            self.overlay_camera.get_image().save(path)
+        return path
+
+
+def render_locales(module, scene_name, locales, quality="l"):
+    base_cls = getattr(module, scene_name)
+    # Keep the scene's name: it picks the partial movie directory, which is what the locales share
+    scene_cls = type(scene_name, (LocaleLayerScene, base_cls), {})
+    previous = get_locale()
+    outputs = {}
+    try:
+        for locale in locales:
+            set_locale(locale)
+            options = {
+                "quality": QUALITY_FLAGS.get(quality, quality),
+                "input_file": module.__file__,
+                "output_file": f"{scene_name}_{locale}",
+                "disable_caching": False,
+                "progress_bar": "none",
+            }
+            with tempconfig(options):
+                renderer = CairoRenderer(camera_class=LayerCamera, file_writer_class=LocaleFileWriter)
+                scene_cls(renderer=renderer).render()
+                writer = renderer.file_writer
+                outputs[locale] = {
+                    "path": str(writer.movie_file_path),
+                    "cache_hits": writer.cache_hits,
+                    "base_plays": len(writer.base_plays),
+                    "plays": renderer.num_plays,
+                }
+            logger.info(f"{scene_name} [{locale}]: {writer.cache_hits}/{renderer.num_plays} segments reused")
+    finally:
+        set_locale(previous)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render scenes for several locales in one job")
+    parser.add_argument("module")
+    parser.add_argument("scenes", nargs="*")
+    parser.add_argument("--locales", help="comma-separated, default: every catalog in locales/")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_FLAGS))
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.getcwd())
+    module = importlib.import_module(args.module)
+    locales = args.locales.split(",") if args.locales else available_locales()
+    for scene_name in args.scenes or scene_names(module):
+        for locale, output in render_locales(module, scene_name, locales, args.quality).items():
+            print(f"{scene_name} [{locale}]: {output['path']} ({output['cache_hits']}/{output['plays']} segments reused)")
+
+
+if __name__ == "__main__":
+    main()
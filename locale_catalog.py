@@ -0,0 +1,47 @@
+"""Locale catalog for every on-screen string in the lecture.
+
+Catalogs live in ``locales/<code>.json`` as flat ``key -> text`` maps (Pango
+markup allowed where the scene uses MarkupText). Keys missing from a
+translation fall back to English. The active locale comes from
+``PLEXUS_LOCALE`` or ``set_locale()``.
+"""
+
+import json
+import os
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LOCALE = "en"
+
+_catalogs = {}
+_active = os.environ.get("PLEXUS_LOCALE", DEFAULT_LOCALE)
+
+
+def available_locales():
+    return sorted(name[:-5] for name in os.listdir(LOCALE_DIR) if name.endswith(".json"))
+
+
+def load(locale):
+    if locale not in _catalogs:
+        path = os.path.join(LOCALE_DIR, f"{locale}.json")
+        if not os.path.exists(path):
+            raise ValueError(f"No catalog for locale {locale!r} (have: {', '.join(available_locales())})")
+        with open(path, encoding="utf-8") as f:
+            _catalogs[locale] = json.load(f)
+    return _catalogs[locale]
+
+
+def set_locale(locale):
+    global _active
+    load(locale)
+    _active = locale
+
+
+def get_locale():
+    return _active
+
+
+def tr(key, locale=None):
+    catalog = load(locale or _active)
+    if key in catalog:
+        return catalog[key]
+    return load(DEFAULT_LOCALE)[key]
@@ -1,5 +1,9 @@
 from manim import *
 
+from frame_sink import renderer_from_env
+from locale_catalog import DEFAULT_LOCALE, tr
+from scene_hashing import IncrementalHashScene
+
 # Define colors for consistency
 ROOT_COLOR = "#FF6B6B"  # Red for roots
 TRUNK_COLOR = "#4ECDC4"  # Teal for trunks
@@ -20,13 +24,25 @@ LABEL_COLOR = WHITE
 INJURY_COLOR = "#FF0000"  # Bright red for injury
 AFFECTED_COLOR = "#CC0000"  # Darker red for affected areas
 
-class BrachialPlexusConstruction(Scene):
+class PlexusScene(IncrementalHashScene):
+    def __init__(self, renderer=None, **kwargs):
+        # PLEXUS_ENCODERS=N switches to the shared-memory frame sink with N encoders
+        if renderer is None:
+            renderer = renderer_from_env(skip_animations=kwargs.get("skip_animations", False))
+        super().__init__(renderer=renderer, **kwargs)
+
+    def keyframe(self, name):
+        # Named checkpoint for benchmarks/keyframes.py; nothing to do in a normal render
+        pass
+
+
+class BrachialPlexusConstruction(PlexusScene):
     def construct(self):
         # Set dark background for aesthetic feel
         #self.camera.background_color = "#0a0e27"
         
         # Title
-        title = Text("The Brachial Plexus", font_size=56, weight=BOLD, color=WHITE, disable_ligatures=True)
+        title = Text(tr("construction.title"), font_size=56, weight=BOLD, color=WHITE, disable_ligatures=True)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title), run_time=1)
         self.wait(1)
@@ -89,18 +105,27 @@ class BrachialPlexusConstruction(Scene):
         plexus_graph.move_to([0.8, -0.1, 0])
         
         # Mnemonics - all with disable_ligatures=True
-        mnemonic_r = MarkupText("<b>R: Roots</b>\nC5-T1", font_size=20, color=ROOT_COLOR, disable_ligatures=True)
-        mnemonic_t = MarkupText("<b>T: Trunks</b>\nSup, Mid, Inf", font_size=20, color=TRUNK_COLOR, disable_ligatures=True)
-        mnemonic_d = MarkupText("<b>D: Divisions</b>\nAnt, Post", font_size=20, color=DIVISION_COLOR_ANT, disable_ligatures=True)
-        mnemonic_c = MarkupText("<b>C: Cords</b>\nLat, Med, Post", font_size=20, color=CORD_COLOR_LATERAL, disable_ligatures=True)
-        mnemonic_b = MarkupText("<b>B: Branches</b>\nTerminal nerves", font_size=20, color=BRANCH_COLOR_MUSC, disable_ligatures=True)
+        mnemonic_r = MarkupText(tr("mnemonic.roots"), font_size=20, color=ROOT_COLOR, disable_ligatures=True)
+        mnemonic_t = MarkupText(tr("mnemonic.trunks"), font_size=20, color=TRUNK_COLOR, disable_ligatures=True)
+        mnemonic_d = MarkupText(tr("mnemonic.divisions"), font_size=20, color=DIVISION_COLOR_ANT, disable_ligatures=True)
+        mnemonic_c = MarkupText(tr("mnemonic.cords"), font_size=20, color=CORD_COLOR_LATERAL, disable_ligatures=True)
+        mnemonic_b = MarkupText(tr("mnemonic.branches"), font_size=20, color=BRANCH_COLOR_MUSC, disable_ligatures=True)
         
         mnemonic_group = VGroup(mnemonic_r, mnemonic_t, mnemonic_d, mnemonic_c, mnemonic_b)
         mnemonic_group.arrange(DOWN, buff=0.25, aligned_edge=LEFT)
         mnemonic_group.move_to([-5.5, 0, 0])
         
+        # Sized from the English mnemonics, so the panel is the same shape in every
+        # locale and the text-free segments can be shared by a locale batch
+        mnemonic_frame = VGroup(*[
+            MarkupText(tr(f"mnemonic.{key}", DEFAULT_LOCALE), font_size=20, disable_ligatures=True)
+            for key in ["roots", "trunks", "divisions", "cords", "branches"]
+        ])
+        mnemonic_frame.arrange(DOWN, buff=0.25, aligned_edge=LEFT)
+        mnemonic_frame.move_to([-5.5, 0, 0])
+
         mnemonic_background = SurroundingRectangle(
-            mnemonic_group,
+            mnemonic_frame,
             buff=0.2,
             fill_color="#1a1f3a", 
             fill_opacity=0.95, 
@@ -120,7 +145,7 @@ class BrachialPlexusConstruction(Scene):
         root_nodes = VGroup(*[plexus_graph.vertices[v] for v in root_keys])
         root_edge_tuples = [("C5", "ST"), ("C6", "ST"), ("C7", "MT"), ("C8", "IT"), ("T1", "IT")]
         root_edges = VGroup(*[plexus_graph.edges[e] for e in root_edge_tuples])
-        root_labels = VGroup(*[Text(v, font_size=14, weight=BOLD, color=WHITE, disable_ligatures=True).next_to(plexus_graph.vertices[v], LEFT, buff=0.3) for v in root_keys])
+        root_labels = VGroup(*[Text(tr(f"root.{v}"), font_size=14, weight=BOLD, color=WHITE, disable_ligatures=True).next_to(plexus_graph.vertices[v], LEFT, buff=0.3) for v in root_keys])
         
         self.play(
             LaggedStart(*[root_nodes[i].animate.set_color(ROOT_COLOR).scale(1.2) for i in range(len(root_nodes))], lag_ratio=0.15),
@@ -136,14 +161,15 @@ class BrachialPlexusConstruction(Scene):
         )
         self.play(LaggedStart(*[Write(label) for label in root_labels], lag_ratio=0.15, run_time=1.5))
         self.wait(1)
+        self.keyframe("roots")
 
         # Trunks
         trunk_keys = ["ST", "MT", "IT"]
         trunk_nodes = VGroup(*[plexus_graph.vertices[v] for v in trunk_keys])
         trunk_labels = VGroup(
-            Text("Superior", font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["ST"], UP, buff=0.25),
-            Text("Middle", font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["MT"], UP, buff=0.25),
-            Text("Inferior", font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["IT"], UP, buff=0.25)
+            Text(tr("trunk.superior"), font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["ST"], UP, buff=0.25),
+            Text(tr("trunk.middle"), font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["MT"], UP, buff=0.25),
+            Text(tr("trunk.inferior"), font_size=11, weight=BOLD, color=TRUNK_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["IT"], UP, buff=0.25)
         )
         
         self.play(Write(mnemonic_t), run_time=0.8)
@@ -166,11 +192,11 @@ class BrachialPlexusConstruction(Scene):
         
         div_label_ant_bg = RoundedRectangle(width=1.3, height=0.4, fill_color="#1a1f3a", fill_opacity=0.9, stroke_color=DIVISION_COLOR_ANT, stroke_width=2, corner_radius=0.1)
         div_label_ant_bg.move_to([0.8, 2.5, 0])
-        div_label_ant = MarkupText("<b>Anterior</b>", color=DIVISION_COLOR_ANT, font_size=13, weight=BOLD, disable_ligatures=True).move_to([0.8, 2.5, 0])
+        div_label_ant = MarkupText(tr("division.anterior"), color=DIVISION_COLOR_ANT, font_size=13, weight=BOLD, disable_ligatures=True).move_to([0.8, 2.5, 0])
         
         div_label_post_bg = RoundedRectangle(width=1.3, height=0.4, fill_color="#1a1f3a", fill_opacity=0.9, stroke_color=DIVISION_COLOR_POST, stroke_width=2, corner_radius=0.1)
         div_label_post_bg.move_to([0.8, -2.2, 0])
-        div_label_post = MarkupText("<b>Posterior</b>", color=DIVISION_COLOR_POST, font_size=13, weight=BOLD, disable_ligatures=True).move_to([0.8, -2.2, 0])
+        div_label_post = MarkupText(tr("division.posterior"), color=DIVISION_COLOR_POST, font_size=13, weight=BOLD, disable_ligatures=True).move_to([0.8, -2.2, 0])
 
         self.play(Write(mnemonic_d), run_time=0.8)
         self.play(
@@ -189,9 +215,9 @@ class BrachialPlexusConstruction(Scene):
 
         # Cords
         cord_labels = VGroup(
-            Text("Lateral", color=CORD_COLOR_LATERAL, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["LC"], UP, buff=0.35),
-            Text("Posterior", color=CORD_COLOR_POSTERIOR, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["PC"], DOWN, buff=0.35),
-            Text("Medial", color=CORD_COLOR_MEDIAL, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["MC"], DOWN, buff=0.35)
+            Text(tr("cord.lateral"), color=CORD_COLOR_LATERAL, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["LC"], UP, buff=0.35),
+            Text(tr("cord.posterior"), color=CORD_COLOR_POSTERIOR, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["PC"], DOWN, buff=0.35),
+            Text(tr("cord.medial"), color=CORD_COLOR_MEDIAL, font_size=11, weight=BOLD, disable_ligatures=True).next_to(plexus_graph.vertices["MC"], DOWN, buff=0.35)
         )
 
         self.play(Write(mnemonic_c), run_time=0.8)
@@ -221,16 +247,17 @@ class BrachialPlexusConstruction(Scene):
         self.play(plexus_graph.edges[("D_IT_A", "MC")].animate.set_color(CORD_COLOR_MEDIAL), run_time=0.4)
         self.play(Write(cord_labels[2]), run_time=0.6)
         self.wait(1)
+        self.keyframe("cords_colored")
 
         # Branches
         self.play(Write(mnemonic_b), run_time=0.8)
         
         branch_data = [
-            ("Musc", BRANCH_COLOR_MUSC, [("LC", "Musc")], "Musculocutaneous"),
-            ("Ax", BRANCH_COLOR_AX, [("PC", "Ax")], "Axillary"),
-            ("Rad", BRANCH_COLOR_RAD, [("PC", "Rad")], "Radial"),
-            ("Med", BRANCH_COLOR_MED, [("LC", "Med"), ("MC", "Med")], "Median"),
-            ("Uln", BRANCH_COLOR_ULN, [("MC", "Uln")], "Ulnar"),
+            ("Musc", BRANCH_COLOR_MUSC, [("LC", "Musc")], tr("branch.musculocutaneous")),
+            ("Ax", BRANCH_COLOR_AX, [("PC", "Ax")], tr("branch.axillary")),
+            ("Rad", BRANCH_COLOR_RAD, [("PC", "Rad")], tr("branch.radial")),
+            ("Med", BRANCH_COLOR_MED, [("LC", "Med"), ("MC", "Med")], tr("branch.median")),
+            ("Uln", BRANCH_COLOR_ULN, [("MC", "Uln")], tr("branch.ulnar")),
         ]
         
         branch_labels_list = []
@@ -249,9 +276,10 @@ class BrachialPlexusConstruction(Scene):
             self.wait(0.4)
         
         self.wait(3)
+        self.keyframe("branches")
 
 
-class ErbsPalsyScene(Scene):
+class ErbsPalsyScene(PlexusScene):
     def construct(self):
         self.camera.background_color = "#0a0e27"
         
@@ -301,7 +329,7 @@ class ErbsPalsyScene(Scene):
         plexus_graph.move_to([1, 0, 0])
         
         # Title
-        title = MarkupText("<b>Clinical Correlate: Erb's Palsy</b>", font_size=44, color=WHITE, disable_ligatures=True)
+        title = MarkupText(tr("erbs.title"), font_size=44, color=WHITE, disable_ligatures=True)
         title.to_edge(UP, buff=0.3)
         
         # Create plexus first
@@ -311,11 +339,11 @@ class ErbsPalsyScene(Scene):
         
         # Info box on left
         info_box = VGroup(
-            MarkupText("<b>Mechanism:</b>", font_size=22, color=YELLOW, disable_ligatures=True),
-            Text("Lateral traction on neck", font_size=18, color=WHITE, disable_ligatures=True),
-            MarkupText("<b>Common causes:</b>", font_size=22, color=YELLOW, disable_ligatures=True),
-            Text("• Birth trauma", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Motorcycle accidents", font_size=16, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("clinical.mechanism"), font_size=22, color=YELLOW, disable_ligatures=True),
+            Text(tr("erbs.mechanism"), font_size=18, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("clinical.common_causes"), font_size=22, color=YELLOW, disable_ligatures=True),
+            Text(tr("erbs.cause.birth_trauma"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("erbs.cause.motorcycle"), font_size=16, color=WHITE, disable_ligatures=True),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
         info_box.to_corner(UL, buff=0.5)
         
@@ -323,7 +351,7 @@ class ErbsPalsyScene(Scene):
         self.wait(1)
         
         # HIGHLIGHT INJURY SITE - C5, C6, Superior Trunk
-        injury_label = MarkupText("<b>INJURY SITE</b>", font_size=26, color=INJURY_COLOR, weight=BOLD, disable_ligatures=True)
+        injury_label = MarkupText(tr("clinical.injury_site"), font_size=26, color=INJURY_COLOR, weight=BOLD, disable_ligatures=True)
         injury_label.next_to(plexus_graph.vertices["ST"], LEFT, buff=1.5)
         
         # Animate injury
@@ -338,9 +366,10 @@ class ErbsPalsyScene(Scene):
         )
         self.play(Flash(plexus_graph.vertices["ST"], color=INJURY_COLOR, flash_radius=0.6, line_length=0.3))
         self.wait(1)
+        self.keyframe("injury")
         
         # HIGHLIGHT AFFECTED DOWNSTREAM STRUCTURES
-        affected_label = MarkupText("<b>AFFECTED DOWNSTREAM</b>", font_size=22, color=AFFECTED_COLOR, weight=BOLD, disable_ligatures=True)
+        affected_label = MarkupText(tr("clinical.affected_downstream"), font_size=22, color=AFFECTED_COLOR, weight=BOLD, disable_ligatures=True)
         affected_label.to_edge(DOWN, buff=0.5)
         
         self.play(Write(affected_label), run_time=0.8)
@@ -375,7 +404,7 @@ class ErbsPalsyScene(Scene):
             plexus_graph.edges[("LC", "Musc")].animate.set_color(AFFECTED_COLOR).set_stroke(width=5),
             run_time=0.7
         )
-        musc_label = Paragraph("Musculocutaneous", font_size=11, weight=BOLD, color=AFFECTED_COLOR, line_spacing=0.5).next_to(plexus_graph.vertices["Musc"], RIGHT, buff=0.2)
+        musc_label = Paragraph(tr("branch.musculocutaneous"), font_size=11, weight=BOLD, color=AFFECTED_COLOR, line_spacing=0.5).next_to(plexus_graph.vertices["Musc"], RIGHT, buff=0.2)
         self.play(Write(musc_label), run_time=0.5)
         
         self.play(
@@ -383,26 +412,27 @@ class ErbsPalsyScene(Scene):
             plexus_graph.edges[("PC", "Ax")].animate.set_color(AFFECTED_COLOR).set_stroke(width=5),
             run_time=0.7
         )
-        ax_label = Text("Axillary", font_size=11, weight=BOLD, color=AFFECTED_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["Ax"], RIGHT, buff=0.2)
+        ax_label = Text(tr("branch.axillary"), font_size=11, weight=BOLD, color=AFFECTED_COLOR, disable_ligatures=True).next_to(plexus_graph.vertices["Ax"], RIGHT, buff=0.2)
         self.play(Write(ax_label), run_time=0.5)
         
         self.wait(2)
         
         # Result description
         result_box = VGroup(
-            MarkupText("<b>Result: 'Waiter's Tip' Posture</b>", font_size=24, color=YELLOW, disable_ligatures=True),
-            Text("• Arm adducted & internally rotated", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Elbow extended", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Forearm pronated", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Wrist flexed", font_size=16, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("erbs.result"), font_size=24, color=YELLOW, disable_ligatures=True),
+            Text(tr("erbs.result.arm"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("erbs.result.elbow"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("erbs.result.forearm"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("erbs.result.wrist"), font_size=16, color=WHITE, disable_ligatures=True),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
         result_box.to_corner(DR, buff=0.5)
         
         self.play(FadeIn(result_box), run_time=1.5)
         self.wait(4)
+        self.keyframe("result")
 
 
-class KlumpkesPalsyScene(Scene):
+class KlumpkesPalsyScene(PlexusScene):
     def construct(self):
         self.camera.background_color = "#0a0e27"
         
@@ -452,7 +482,7 @@ class KlumpkesPalsyScene(Scene):
         plexus_graph.move_to([1, 0, 0])
         
         # Title
-        title = MarkupText("<b>Clinical Correlate: Klumpke's Palsy</b>", font_size=44, color=WHITE, disable_ligatures=True)
+        title = MarkupText(tr("klumpke.title"), font_size=44, color=WHITE, disable_ligatures=True)
         title.to_edge(UP, buff=0.3)
         
         # Create plexus first
@@ -462,11 +492,11 @@ class KlumpkesPalsyScene(Scene):
         
         # Info box on left
         info_box = VGroup(
-            MarkupText("<b>Mechanism:</b>", font_size=22, color=YELLOW, disable_ligatures=True),
-            Text("Hyper-abduction of arm", font_size=18, color=WHITE, disable_ligatures=True),
-            MarkupText("<b>Common causes:</b>", font_size=22, color=YELLOW, disable_ligatures=True),
-            Text("• Grabbing object during fall", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Birth injury", font_size=16, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("clinical.mechanism"), font_size=22, color=YELLOW, disable_ligatures=True),
+            Text(tr("klumpke.mechanism"), font_size=18, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("clinical.common_causes"), font_size=22, color=YELLOW, disable_ligatures=True),
+            Text(tr("klumpke.cause.fall"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("klumpke.cause.birth_injury"), font_size=16, color=WHITE, disable_ligatures=True),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
         info_box.to_corner(UL, buff=0.5)
         
@@ -474,7 +504,7 @@ class KlumpkesPalsyScene(Scene):
         self.wait(1)
         
         # HIGHLIGHT INJURY SITE - C8, T1, Inferior Trunk
-        injury_label = MarkupText("<b>INJURY SITE</b>", font_size=26, color=INJURY_COLOR, weight=BOLD, disable_ligatures=True)
+        injury_label = MarkupText(tr("clinical.injury_site"), font_size=26, color=INJURY_COLOR, weight=BOLD, disable_ligatures=True)
         injury_label.next_to(plexus_graph.vertices["IT"], LEFT, buff=1.5)
         
         # Animate injury
@@ -489,9 +519,10 @@ class KlumpkesPalsyScene(Scene):
         )
         self.play(Flash(plexus_graph.vertices["IT"], color=INJURY_COLOR, flash_radius=0.6, line_length=0.3))
         self.wait(1)
+        self.keyframe("injury")
         
         # HIGHLIGHT AFFECTED DOWNSTREAM STRUCTURES
-        affected_label = MarkupText("<b>AFFECTED DOWNSTREAM</b>", font_size=22, color=AFFECTED_COLOR, weight=BOLD, disable_ligatures=True)
+        affected_label = MarkupText(tr("clinical.affected_downstream"), font_size=22, color=AFFECTED_COLOR, weight=BOLD, disable_ligatures=True)
         affected_label.to_edge(DOWN, buff=0.5)
         
         self.play(Write(affected_label), run_time=0.8)
@@ -515,7 +546,7 @@ class KlumpkesPalsyScene(Scene):
             plexus_graph.edges[("MC", "Uln")].animate.set_color(AFFECTED_COLOR).set_stroke(width=5),
             run_time=0.7
         )
-        uln_label = Text("Ulnar", font_size=11, weight=BOLD, color=AFFECTED_COLOR, font="sans-serif", slant=NORMAL).next_to(plexus_graph.vertices["Uln"], RIGHT, buff=0.2)
+        uln_label = Text(tr("branch.ulnar"), font_size=11, weight=BOLD, color=AFFECTED_COLOR, font="sans-serif", slant=NORMAL).next_to(plexus_graph.vertices["Uln"], RIGHT, buff=0.2)
         self.play(Write(uln_label), run_time=0.5)
         
         # Median nerve (partially affected via medial cord contribution)
@@ -524,18 +555,18 @@ class KlumpkesPalsyScene(Scene):
             plexus_graph.edges[("MC", "Med")].animate.set_color(AFFECTED_COLOR).set_stroke(width=5),
             run_time=0.7
         )
-        med_label = Text("Median (partial)", font_size=10, weight=BOLD, color=AFFECTED_COLOR, font="sans-serif", slant=NORMAL).next_to(plexus_graph.vertices["Med"], RIGHT, buff=0.2)
+        med_label = Text(tr("klumpke.median_partial"), font_size=10, weight=BOLD, color=AFFECTED_COLOR, font="sans-serif", slant=NORMAL).next_to(plexus_graph.vertices["Med"], RIGHT, buff=0.2)
         self.play(Write(med_label), run_time=0.5)
         
         self.wait(2)
         
         # Result description
         result_box = VGroup(
-            MarkupText("<b>Result: 'Claw Hand' Deformity</b>", font_size=24, color=YELLOW, disable_ligatures=True),
-            Text("• Intrinsic hand muscle paralysis", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Hyperextension at MCP joints", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Flexion at IP joints", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Loss of finger abduction/adduction", font_size=16, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("klumpke.result"), font_size=24, color=YELLOW, disable_ligatures=True),
+            Text(tr("klumpke.result.intrinsic"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("klumpke.result.mcp"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("klumpke.result.ip"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("klumpke.result.abduction"), font_size=16, color=WHITE, disable_ligatures=True),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
         result_box.to_corner(DR, buff=0.5)
         
@@ -543,20 +574,21 @@ class KlumpkesPalsyScene(Scene):
         self.wait(1)
         
         # Horner's syndrome note
-        horner_note = MarkupText("<b>Associated: Horner's Syndrome</b>\n(if T1 injury affects sympathetic chain)", 
+        horner_note = MarkupText(tr("klumpke.horner"), 
                                  font_size=16, color=YELLOW, disable_ligatures=True)
         horner_note.next_to(result_box, UP, buff=0.3)
         self.play(Write(horner_note), run_time=1)
         
         self.wait(4)
+        self.keyframe("result")
 
 
-class NonTerminalBranchesScene(Scene):
+class NonTerminalBranchesScene(PlexusScene):
     def construct(self):
         self.camera.background_color = "#0a0e27"
         
         # Title
-        title = MarkupText("<b>Non-Terminal Branches of the Brachial Plexus</b>", 
+        title = MarkupText(tr("nonterminal.title"), 
                           font_size=44, color=WHITE, disable_ligatures=True)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title), run_time=1)
@@ -606,7 +638,7 @@ class NonTerminalBranchesScene(Scene):
         THORACODORSAL_COLOR = "#FFB5A7"
         
         # Category 1: FROM ROOTS
-        cat1_title = MarkupText("<b>FROM ROOTS</b>", font_size=28, color=YELLOW, disable_ligatures=True)
+        cat1_title = MarkupText(tr("nonterminal.from_roots"), font_size=28, color=YELLOW, disable_ligatures=True)
         cat1_title.to_edge(LEFT, buff=0.5).shift(UP * 2.5)
         self.play(Write(cat1_title), run_time=0.8)
         self.wait(0.3)
@@ -616,7 +648,7 @@ class NonTerminalBranchesScene(Scene):
         dorsal_scap_end = dorsal_scap_start + np.array([0.8, 0.5, 0])
         dorsal_scap_line = Line(dorsal_scap_start, dorsal_scap_end, color=DORSAL_SCAP_COLOR, stroke_width=3)
         dorsal_scap_dot = Dot(dorsal_scap_end, radius=0.08, color=DORSAL_SCAP_COLOR)
-        dorsal_scap_label = Text("Dorsal Scapular\n(C5)", font_size=11, color=DORSAL_SCAP_COLOR, disable_ligatures=True)
+        dorsal_scap_label = Text(tr("nonterminal.dorsal_scapular"), font_size=11, color=DORSAL_SCAP_COLOR, disable_ligatures=True)
         dorsal_scap_label.next_to(dorsal_scap_dot, RIGHT, buff=0.15)
         
         self.play(Create(dorsal_scap_line), run_time=0.5)
@@ -628,7 +660,7 @@ class NonTerminalBranchesScene(Scene):
         long_thor_end = long_thor_start + np.array([0.8, -0.8, 0])
         long_thor_line = Line(long_thor_start, long_thor_end, color=LONG_THORACIC_COLOR, stroke_width=3)
         long_thor_dot = Dot(long_thor_end, radius=0.08, color=LONG_THORACIC_COLOR)
-        long_thor_label = Text("Long Thoracic\n(C5-C7)", font_size=11, color=LONG_THORACIC_COLOR, disable_ligatures=True)
+        long_thor_label = Text(tr("nonterminal.long_thoracic"), font_size=11, color=LONG_THORACIC_COLOR, disable_ligatures=True)
         long_thor_label.next_to(long_thor_dot, RIGHT, buff=0.15)
         
         # Show connections from C5, C6, C7
@@ -642,7 +674,7 @@ class NonTerminalBranchesScene(Scene):
         self.wait(0.8)
         
         # Category 2: FROM SUPERIOR TRUNK
-        cat2_title = MarkupText("<b>FROM SUPERIOR TRUNK</b>", font_size=28, color=YELLOW, disable_ligatures=True)
+        cat2_title = MarkupText(tr("nonterminal.from_superior_trunk"), font_size=28, color=YELLOW, disable_ligatures=True)
         cat2_title.to_edge(LEFT, buff=0.5).shift(UP * 0.5)
         self.play(Write(cat2_title), run_time=0.8)
         self.wait(0.3)
@@ -656,7 +688,7 @@ class NonTerminalBranchesScene(Scene):
         supra_end = supra_start + np.array([1.2, 0.8, 0])
         supra_line = Line(supra_start, supra_end, color=SUPRASCAP_COLOR, stroke_width=3)
         supra_dot = Dot(supra_end, radius=0.08, color=SUPRASCAP_COLOR)
-        supra_label = Text("Suprascapular", font_size=11, color=SUPRASCAP_COLOR, disable_ligatures=True)
+        supra_label = Text(tr("nonterminal.suprascapular"), font_size=11, color=SUPRASCAP_COLOR, disable_ligatures=True)
         supra_label.next_to(supra_dot, RIGHT, buff=0.15)
         
         self.play(Create(supra_line), run_time=0.5)
@@ -668,7 +700,7 @@ class NonTerminalBranchesScene(Scene):
         subclav_end = subclav_start + np.array([1.2, 0.3, 0])
         subclav_line = Line(subclav_start, subclav_end, color=NERVE_TO_SUBCLAV_COLOR, stroke_width=3)
         subclav_dot = Dot(subclav_end, radius=0.08, color=NERVE_TO_SUBCLAV_COLOR)
-        subclav_label = Text("N. to Subclavius", font_size=11, color=NERVE_TO_SUBCLAV_COLOR, disable_ligatures=True)
+        subclav_label = Text(tr("nonterminal.subclavius"), font_size=11, color=NERVE_TO_SUBCLAV_COLOR, disable_ligatures=True)
         subclav_label.next_to(subclav_dot, RIGHT, buff=0.15)
         
         self.play(Create(subclav_line), run_time=0.5)
@@ -676,7 +708,7 @@ class NonTerminalBranchesScene(Scene):
         self.wait(0.8)
         
         # Category 3: FROM LATERAL CORD
-        cat3_title = MarkupText("<b>FROM LATERAL CORD</b>", font_size=28, color=YELLOW, disable_ligatures=True)
+        cat3_title = MarkupText(tr("nonterminal.from_lateral_cord"), font_size=28, color=YELLOW, disable_ligatures=True)
         cat3_title.to_edge(LEFT, buff=0.5).shift(DOWN * 1.0)
         self.play(Write(cat3_title), run_time=0.8)
         self.wait(0.3)
@@ -690,7 +722,7 @@ class NonTerminalBranchesScene(Scene):
         lat_pect_end = lat_pect_start + np.array([1.5, 0.5, 0])
         lat_pect_line = Line(lat_pect_start, lat_pect_end, color=LAT_PECT_COLOR, stroke_width=3)
         lat_pect_dot = Dot(lat_pect_end, radius=0.08, color=LAT_PECT_COLOR)
-        lat_pect_label = Text("Lateral Pectoral", font_size=11, color=LAT_PECT_COLOR, disable_ligatures=True)
+        lat_pect_label = Text(tr("nonterminal.lateral_pectoral"), font_size=11, color=LAT_PECT_COLOR, disable_ligatures=True)
         lat_pect_label.next_to(lat_pect_dot, RIGHT, buff=0.15)
         
         self.play(Create(lat_pect_line), run_time=0.5)
@@ -698,7 +730,7 @@ class NonTerminalBranchesScene(Scene):
         self.wait(0.8)
         
         # Category 4: FROM MEDIAL CORD
-        cat4_title = MarkupText("<b>FROM MEDIAL CORD</b>", font_size=28, color=YELLOW, disable_ligatures=True)
+        cat4_title = MarkupText(tr("nonterminal.from_medial_cord"), font_size=28, color=YELLOW, disable_ligatures=True)
         cat4_title.to_edge(LEFT, buff=0.5).shift(DOWN * 2.5)
         self.play(Write(cat4_title), run_time=0.8)
         self.wait(0.3)
@@ -712,7 +744,7 @@ class NonTerminalBranchesScene(Scene):
         med_pect_end = med_pect_start + np.array([1.5, -0.3, 0])
         med_pect_line = Line(med_pect_start, med_pect_end, color=MED_PECT_COLOR, stroke_width=3)
         med_pect_dot = Dot(med_pect_end, radius=0.08, color=MED_PECT_COLOR)
-        med_pect_label = Text("Medial Pectoral", font_size=11, color=MED_PECT_COLOR, disable_ligatures=True)
+        med_pect_label = Text(tr("nonterminal.medial_pectoral"), font_size=11, color=MED_PECT_COLOR, disable_ligatures=True)
         med_pect_label.next_to(med_pect_dot, RIGHT, buff=0.15)
         
         self.play(Create(med_pect_line), run_time=0.5)
@@ -724,7 +756,7 @@ class NonTerminalBranchesScene(Scene):
         med_cut_arm_end = med_cut_arm_start + np.array([1.5, -0.8, 0])
         med_cut_arm_line = Line(med_cut_arm_start, med_cut_arm_end, color=MED_CUT_ARM_COLOR, stroke_width=3)
         med_cut_arm_dot = Dot(med_cut_arm_end, radius=0.08, color=MED_CUT_ARM_COLOR)
-        med_cut_arm_label = Text("Med. Cut. N. of Arm", font_size=10, color=MED_CUT_ARM_COLOR, disable_ligatures=True)
+        med_cut_arm_label = Text(tr("nonterminal.med_cut_arm"), font_size=10, color=MED_CUT_ARM_COLOR, disable_ligatures=True)
         med_cut_arm_label.next_to(med_cut_arm_dot, RIGHT, buff=0.15)
         
         self.play(Create(med_cut_arm_line), run_time=0.5)
@@ -736,7 +768,7 @@ class NonTerminalBranchesScene(Scene):
         med_cut_fore_end = med_cut_fore_start + np.array([1.5, -1.3, 0])
         med_cut_fore_line = Line(med_cut_fore_start, med_cut_fore_end, color=MED_CUT_FOREARM_COLOR, stroke_width=3)
         med_cut_fore_dot = Dot(med_cut_fore_end, radius=0.08, color=MED_CUT_FOREARM_COLOR)
-        med_cut_fore_label = Text("Med. Cut. N. of Forearm", font_size=10, color=MED_CUT_FOREARM_COLOR, disable_ligatures=True)
+        med_cut_fore_label = Text(tr("nonterminal.med_cut_forearm"), font_size=10, color=MED_CUT_FOREARM_COLOR, disable_ligatures=True)
         med_cut_fore_label.next_to(med_cut_fore_dot, RIGHT, buff=0.15)
         
         self.play(Create(med_cut_fore_line), run_time=0.5)
@@ -751,7 +783,7 @@ class NonTerminalBranchesScene(Scene):
         )
         
         # Category 5: FROM POSTERIOR CORD
-        cat5_title = MarkupText("<b>FROM POSTERIOR CORD</b>", font_size=28, color=YELLOW, disable_ligatures=True)
+        cat5_title = MarkupText(tr("nonterminal.from_posterior_cord"), font_size=28, color=YELLOW, disable_ligatures=True)
         cat5_title.to_edge(LEFT, buff=0.5).shift(UP * 1.5)
         self.play(Write(cat5_title), run_time=0.8)
         self.wait(0.3)
@@ -765,7 +797,7 @@ class NonTerminalBranchesScene(Scene):
         upper_sub_end = upper_sub_start + np.array([1.5, 0.8, 0])
         upper_sub_line = Line(upper_sub_start, upper_sub_end, color=UPPER_SUBSCAP_COLOR, stroke_width=3)
         upper_sub_dot = Dot(upper_sub_end, radius=0.08, color=UPPER_SUBSCAP_COLOR)
-        upper_sub_label = Text("Upper Subscapular", font_size=11, color=UPPER_SUBSCAP_COLOR, disable_ligatures=True)
+        upper_sub_label = Text(tr("nonterminal.upper_subscapular"), font_size=11, color=UPPER_SUBSCAP_COLOR, disable_ligatures=True)
         upper_sub_label.next_to(upper_sub_dot, RIGHT, buff=0.15)
         
         self.play(Create(upper_sub_line), run_time=0.5)
@@ -777,7 +809,7 @@ class NonTerminalBranchesScene(Scene):
         thoraco_end = thoraco_start + np.array([1.5, 0.3, 0])
         thoraco_line = Line(thoraco_start, thoraco_end, color=THORACODORSAL_COLOR, stroke_width=3)
         thoraco_dot = Dot(thoraco_end, radius=0.08, color=THORACODORSAL_COLOR)
-        thoraco_label = Text("Thoracodorsal", font_size=11, color=THORACODORSAL_COLOR, disable_ligatures=True)
+        thoraco_label = Text(tr("nonterminal.thoracodorsal"), font_size=11, color=THORACODORSAL_COLOR, disable_ligatures=True)
         thoraco_label.next_to(thoraco_dot, RIGHT, buff=0.15)
         
         self.play(Create(thoraco_line), run_time=0.5)
@@ -789,7 +821,7 @@ class NonTerminalBranchesScene(Scene):
         lower_sub_end = lower_sub_start + np.array([1.5, -0.2, 0])
         lower_sub_line = Line(lower_sub_start, lower_sub_end, color=LOWER_SUBSCAP_COLOR, stroke_width=3)
         lower_sub_dot = Dot(lower_sub_end, radius=0.08, color=LOWER_SUBSCAP_COLOR)
-        lower_sub_label = Text("Lower Subscapular", font_size=11, color=LOWER_SUBSCAP_COLOR, disable_ligatures=True)
+        lower_sub_label = Text(tr("nonterminal.lower_subscapular"), font_size=11, color=LOWER_SUBSCAP_COLOR, disable_ligatures=True)
         lower_sub_label.next_to(lower_sub_dot, RIGHT, buff=0.15)
         
         self.play(Create(lower_sub_line), run_time=0.5)
@@ -798,12 +830,13 @@ class NonTerminalBranchesScene(Scene):
         
         # Summary note
         summary = VGroup(
-            MarkupText("<b>Key Points:</b>", font_size=20, color=YELLOW, disable_ligatures=True),
-            Text("• 11 major non-terminal branches", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Innervate shoulder/chest muscles", font_size=16, color=WHITE, disable_ligatures=True),
-            Text("• Critical for proximal limb function", font_size=16, color=WHITE, disable_ligatures=True),
+            MarkupText(tr("nonterminal.key_points"), font_size=20, color=YELLOW, disable_ligatures=True),
+            Text(tr("nonterminal.key_points.count"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("nonterminal.key_points.innervate"), font_size=16, color=WHITE, disable_ligatures=True),
+            Text(tr("nonterminal.key_points.proximal"), font_size=16, color=WHITE, disable_ligatures=True),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         summary.to_corner(DL, buff=0.5)
         
         self.play(FadeIn(summary), run_time=1.5)
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+        self.keyframe("summary")
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""Whole-lecture preview rendered within a wall-clock budget.
+
+Records every scene's play/wait timeline with the cost estimator, then picks
+the most faithful preview settings whose predicted cost fits the budget
+(minus the time spent recording). The settings are resolution, frame rate,
+a cap on waits and a cap on each play's length (fewer frames per play). In
+preview, ``Write`` is drawn as a fade, which skips the per-glyph stroke
+animation. The scenes are then rendered and joined into one video.
+
+    python preview.py main_plexus --budget 20
+"""
+
+import argparse
+import importlib
+import math
+import os
+import subprocess
+import sys
+import time
+
+from manim import DEFAULT_WAIT_TIME, AnimationGroup, FadeIn, Wait, Write, config, logger, tempconfig
+
+from cost_estimator import load_model, play_cost, record_timeline, scene_names
+
+# (pixel_height, pixel_width, frame_rate), most to least detailed
+LADDER = [
+    (480, 854, 15),
+    (360, 640, 12),
+    (270, 480, 10),
+    (180, 320, 8),
+    (144, 256, 6),
+]
+
+# (max wait seconds, max play seconds), all tried at a rung before moving down the ladder
+POLICIES = [
+    (0.5, None),
+    (0.25, 1.0),
+    (0.1, 0.5),
+    (0.05, 0.25),
+]
+
+
+def without_text_paths(animation):
+    if isinstance(animation, Write):
+        return FadeIn(animation.mobject, run_time=animation.run_time, rate_func=animation.rate_func)
+    if isinstance(animation, AnimationGroup):
+        animation.animations = [without_text_paths(sub) for sub in animation.animations]
+        # Same run times as before, so the lag schedule is unchanged
+        animation.build_animations_with_timings()
+    return animation
+
+
+class PreviewScene:
+    # Mixed in ahead of a scene class by render_preview()
+    max_wait = None
+    max_play = None
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame=None):
+        if self.max_wait is not None:
+            duration = min(duration, self.max_wait)
+        super().wait(duration, stop_condition=stop_condition, frozen_frame=frozen_frame)
+
+    def play(self, *args, subcaption=None, subcaption_duration=None, subcaption_offset=0, **kwargs):
+        animations = [without_text_paths(animation) for animation in self.compile_animations(*args, **kwargs)]
+        is_wait = len(animations) == 1 and isinstance(animations[0], Wait)
+        if self.max_play is not None and not is_wait:
+            run_time = self.get_run_time(animations)
+            if run_time > self.max_play:
+                for animation in animations:
+                    animation.run_time *= self.max_play / run_time
+        super().play(
+            *animations,
+            subcaption=subcaption,
+            subcaption_duration=subcaption_duration,
+            subcaption_offset=subcaption_offset,
+        )
+
+
+def preview_play(play, policy, frame_rate):
+    max_wait, max_play = policy
+    duration = play["duration"]
+    if play["kind"] == "wait" and max_wait is not None:
+        duration = min(duration, max_wait)
+    elif play["kind"] == "play" and max_play is not None:
+        duration = min(duration, max_play)
+    frames = int(duration * frame_rate) if play["frozen"] else math.ceil(duration * frame_rate)
+    return {**play, "duration": duration, "frames": frames}
+
+
+def predict(timelines, policy, rung, model):
+    height, width, frame_rate = rung
+    megapixels = height * width / 1e6
+    return sum(
+        model["scene"] + sum(play_cost(preview_play(play, policy, frame_rate), megapixels, model) for play in plays)
+        for plays in timelines.values()
+    )
+
+
+def plan(timelines, budget, model):
+    # Tighten the wait and play caps at each resolution before dropping to the next one
+    candidates = [(policy, rung) for rung in LADDER for policy in POLICIES]
+    for policy, rung in candidates:
+        cost = predict(timelines, policy, rung, model)
+        if cost <= budget:
+            return policy, rung, cost
+    policy, rung = candidates[-1]
+    cost = predict(timelines, policy, rung, model)
+    logger.warning(f"Cheapest preview is predicted at {cost:.1f}s, over the {budget:g}s budget")
+    return policy, rung, cost
+
+
+def render_preview(module, names, policy, rung):
+    height, width, frame_rate = rung
+    max_wait, max_play = policy
+    outputs = []
+    for name in names:
+        base_cls = getattr(module, name)
+        scene_cls = type(name, (PreviewScene, base_cls), {"max_wait": max_wait, "max_play": max_play})
+        options = {
+            "pixel_height": height,
+            "pixel_width": width,
+            "frame_rate": frame_rate,
+            "input_file": module.__file__,
+            "output_file": f"{name}_preview",
+            "progress_bar": "none",
+        }
+        with tempconfig(options):
+            scene = scene_cls()
+            scene.render()
+            outputs.append(scene.renderer.file_writer.movie_file_path)
+    return outputs
+
+
+def join(paths, output):
+    list_path = output.with_suffix(".txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            f.write(f"file 'file:{path.as_posix()}'\n")
+    # config.ffmpeg_executable is manim 0.18 only, pinned in requirements.txt
+    subprocess.run(
+        [config.ffmpeg_executable, "-y", "-f", "concat", "-safe", "0", "-i", str(list_path),
+         "-loglevel", config["ffmpeg_loglevel"].lower(), "-c", "copy", str(output)],
+        check=True,
+    )
+    list_path.unlink()
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a time-budgeted preview of the lecture")
+    parser.add_argument("module")
+    parser.add_argument("scenes", nargs="*")
+    parser.add_argument("--budget", type=float, default=20.0, help="wall-clock seconds for the whole preview")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sys.path.insert(0, os.getcwd())
+    module = importlib.import_module(args.module)
+    names = args.scenes or scene_names(module)
+    timelines = {name: record_timeline(module, name, "l")[0] for name in names}
+
+    remaining = args.budget - (time.perf_counter() - start)
+    policy, rung, predicted = plan(timelines, remaining, load_model())
+    print(f"preview at {rung[0]}p{rung[2]}, waits <= {policy[0]}s, plays <= {policy[1] or 'full'}s "
+          f"(predicted {predicted:.1f}s of {remaining:.1f}s left)", flush=True)
+
+    outputs = render_preview(module, names, policy, rung)
+    output = outputs[0].with_name("lecture_preview.mp4")
+    join(outputs, output)
+    print(f"{output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Warm render daemon for the plexus scenes.
+
+Keeps the interpreter, the manim import, the Pango font map and the ffmpeg
+lookup alive between renders. Jobs come in over a Unix socket and are picked
+up by a pool of pre-forked workers, which stream progress back as JSON lines.
+Renders that reused no cached segment are appended to the timings log
+(``render_options.TIMINGS_PATH``) that ``cost_estimator.py calibrate`` fits.
+
+    python render_daemon.py serve --workers 4
+    python render_daemon.py submit main_plexus ErbsPalsyScene -q l -o erbs.mp4
+"""
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import signal
+import socket
+import sys
+import time
+import traceback
+
+from render_options import QUALITY_FLAGS, TIMINGS_PATH
+
+DEFAULT_SOCKET = os.environ.get("PLEXUS_RENDER_SOCKET", "/tmp/plexus-render.sock")
+
+
+def warm_up():
+    # Everything imported or initialised here is inherited by the forked workers.
+    # config.ffmpeg_executable is manim 0.18 only (pinned in requirements.txt)
+    from manim import Text, config
+
+    if shutil.which(str(config.ffmpeg_executable)) is None:
+        raise RuntimeError(f"ffmpeg not found ({config.ffmpeg_executable})")
+    # Building one Text initialises Pango and loads the font map
+    Text("The Brachial Plexus", font_size=14, disable_ligatures=True)
+
+
+def send(conn, **event):
+    conn.sendall((json.dumps(event) + "\n").encode())
+
+
+def read_job(conn):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data)
+
+
+def run_job(job, conn, worker):
+    from manim import config, tempconfig
+
+    # Reload so edits to the scene file are picked up without restarting the daemon
+    if job["module"] in sys.modules:
+        module = importlib.reload(sys.modules[job["module"]])
+    else:
+        module = importlib.import_module(job["module"])
+    scene_cls = getattr(module, job["scene"])
+    quality = QUALITY_FLAGS.get(job.get("quality", "l"), job.get("quality"))
+
+    # Workers render concurrently: each gets its own media dir so partial
+    # movie files, the cache index and the output name never collide
+    options = {
+        "quality": quality,
+        "input_file": module.__file__,
+        "progress_bar": "none",
+        "media_dir": os.path.join(config.media_dir, f"worker-{worker}"),
+    }
+    if job.get("output"):
+        options["output_file"] = os.path.splitext(os.path.basename(job["output"]))[0]
+
+    cached = 0
+    with tempconfig(options):
+        scene = scene_cls()
+        scene_play = scene.play
+
+        def play(*args, **kwargs):
+            nonlocal cached
+            scene_play(*args, **kwargs)
+            # The renderer skips a play whose partial movie is already cached
+            cached += scene.renderer.skip_animations
+            send(conn, event="play", index=scene.renderer.num_plays, time=round(scene.renderer.time, 3))
+
+        # construct() calls self.play (and wait() goes through it), so every
+        # animation reports back once it has been written
+        scene.play = play
+        scene.render()
+        path = str(scene.renderer.file_writer.movie_file_path)
+
+    if job.get("output"):
+        os.makedirs(os.path.dirname(os.path.abspath(job["output"])), exist_ok=True)
+        path = shutil.move(path, job["output"])
+    return path, cached
+
+
+def log_timing(job, seconds):
+    # One write per line, so lines from concurrent workers don't interleave
+    record = {"module": job["module"], "scene": job["scene"], "quality": job.get("quality", "l"), "seconds": seconds}
+    os.makedirs(os.path.dirname(TIMINGS_PATH), exist_ok=True)
+    with open(TIMINGS_PATH, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def worker_loop(server, worker):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            start = time.perf_counter()
+            try:
+                job = read_job(conn)
+                send(conn, event="start", pid=os.getpid(), scene=job["scene"])
+                path, cached = run_job(job, conn, worker)
+                seconds = round(time.perf_counter() - start, 3)
+                send(conn, event="done", path=path, seconds=seconds, cached=cached)
+                # Renders that reused cached segments would skew the cost model
+                if not cached:
+                    log_timing(job, seconds)
+            except BrokenPipeError:
+                pass
+            except Exception as exc:
+                try:
+                    send(conn, event="error", message=str(exc), traceback=traceback.format_exc())
+                except OSError:
+                    pass
+
+
+def spawn_worker(server, worker):
+    pid = os.fork()
+    if pid == 0:
+        try:
+            worker_loop(server, worker)
+        finally:
+            os._exit(1)
+    return pid
+
+
+def serve(socket_path, workers):
+    # Scene modules are imported by name, relative to where the daemon runs
+    sys.path.insert(0, os.getcwd())
+    warm_up()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(64)
+
+    # Pre-fork: all workers block in accept() on the same listening socket
+    # pid -> worker number, which a replacement worker inherits
+    children = {spawn_worker(server, worker): worker for worker in range(workers)}
+    print(f"render daemon listening on {socket_path} with {workers} workers", flush=True)
+
+    def shutdown(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        server.close()
+        os.unlink(socket_path)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    # Replace any worker that dies (segfault in cairo, OOM, ...)
+    while True:
+        pid, _ = os.wait()
+        if pid in children:
+            worker = children.pop(pid)
+            children[spawn_worker(server, worker)] = worker
+
+
+def submit(socket_path, job):
+    if job.get("output"):
+        # The worker resolves paths against its own working directory, not ours
+        job = {**job, "output": os.path.abspath(job["output"])}
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(socket_path)
+    client.sendall((json.dumps(job) + "\n").encode())
+    ok = False
+    with client, client.makefile("r") as stream:
+        for line in stream:
+            event = json.loads(line)
+            if event["event"] == "play":
+                print(f"  play {event['index']} (t={event['time']}s)", flush=True)
+            elif event["event"] == "start":
+                print(f"{event['scene']} started on worker {event['pid']}", flush=True)
+            elif event["event"] == "done":
+                print(f"done in {event['seconds']}s: {event['path']}", flush=True)
+                ok = True
+            elif event["event"] == "error":
+                print(event["traceback"], file=sys.stderr)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm render daemon for the plexus scenes")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve")
+    serve_parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+
+    submit_parser = commands.add_parser("submit")
+    submit_parser.add_argument("module")
+    submit_parser.add_argument("scene")
+    submit_parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_FLAGS))
+    submit_parser.add_argument("-o", "--output")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args.socket, args.workers)
+    else:
+        job = {"module": args.module, "scene": args.scene, "quality": args.quality, "output": args.output}
+        sys.exit(0 if submit(args.socket, job) else 1)
+
+
+if __name__ == "__main__":
+    main()
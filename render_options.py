@@ -0,0 +1,21 @@
+"""Render settings shared by the daemon, the cost estimator and the batch tools.
+
+Kept free of manim imports so the daemon can load it before warming up.
+"""
+
+import os
+
+# Same letters as the manim CLI's -q flag
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# Measured renders, one JSON line each, appended by the daemon and read by
+# ``cost_estimator.py calibrate``
+TIMINGS_PATH = os.environ.get(
+    "PLEXUS_TIMINGS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "timings.jsonl")
+)
@@ -0,0 +1,224 @@
+"""Incremental play-call hashing for long scenes.
+
+manim names each partial movie file after a hash of the camera, the
+animations and *every* mobject on screen, serialised to JSON on every play.
+Late in a scene that means re-serialising the whole graph, the mnemonic panel
+and every label each time. ``IncrementalHashScene`` keeps a hash per mobject
+in the scene tree: each node's own JSON (children elided) plus a combined
+hash of its subtree. Mobjects are marked dirty when they are mutated, and a
+play only re-serialises the dirty nodes and recombines the subtree hashes on
+their path to the top, so hashing cost follows what changed, not scene size.
+
+Mutations are picked up from attribute assignment (which covers manim's
+``points``/colour/stroke setters and ``add``), from the methods that edit
+arrays or the submobject list in place, and from every mobject an animation
+played on. The in-place list below was taken from manim 0.18, which
+requirements.txt pins.
+"""
+
+import functools
+import weakref
+import zlib
+
+from manim import (
+    ComplexValueTracker,
+    DecimalNumber,
+    Mobject,
+    PMobject,
+    Scene,
+    ValueTracker,
+    VGroup,
+    VMobject,
+)
+from manim.renderer import cairo_renderer
+from manim.utils import hashing
+
+# id(cache) -> that cache's set of ids mutated since its last hash
+_pending = {}
+
+
+def mark_dirty(mobject):
+    key = id(mobject)
+    for pending in _pending.values():
+        pending.add(key)
+
+
+def mark_family_dirty(mobject):
+    for member in mobject.get_family():
+        mark_dirty(member)
+
+
+def _setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    mark_dirty(self)
+
+
+def _marks_dirty(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        mark_dirty(self)
+        return result
+    return wrapper
+
+
+def _marks_family_dirty(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Before as well: members may be written to and then dropped from the family
+        mark_family_dirty(self)
+        result = method(self, *args, **kwargs)
+        mark_family_dirty(self)
+        return result
+    return wrapper
+
+
+class _Node:
+    __slots__ = ("mobject", "own", "tree", "children")
+
+    def __init__(self, mobject):
+        self.mobject = mobject
+        self.own = None
+        self.tree = None
+        self.children = ()
+
+
+class MobjectHashCache:
+    def __init__(self):
+        # id(mobject) -> _Node, for every mobject hashed so far
+        self.nodes = {}
+        # id(child) -> ids of the mobjects that had it as a submobject when last hashed
+        self.parents = {}
+        self.roots = {}
+        self.dirty = set()
+        self.hits = 0
+        self.misses = 0
+        _pending[id(self)] = self.dirty
+        weakref.finalize(self, _pending.pop, id(self), None)
+
+    def invalidate(self, key):
+        stack = [key]
+        while stack:
+            key = stack.pop()
+            node = self.nodes.get(key)
+            # A node without a subtree hash has none on any ancestor either
+            if node is not None and node.tree is not None:
+                node.tree = None
+                stack.extend(self.parents.get(key, ()))
+
+    def collect(self):
+        dirty = list(self.dirty)
+        self.dirty.clear()
+        for key in dirty:
+            node = self.nodes.get(key)
+            if node is not None:
+                node.own = None
+                self.invalidate(key)
+
+    def own_hash(self, scene, node):
+        mobject = node.mobject
+        # Same serialisation manim uses, scoped to this node: submobjects
+        # serialise as placeholders and are hashed as their own nodes
+        hashing._Memoizer.mark_as_processed(scene)
+        for child in mobject.submobjects:
+            hashing._Memoizer.mark_as_processed(child)
+        value = zlib.crc32(repr(hashing.get_json(mobject)).encode())
+        hashing._Memoizer.reset_already_processed()
+
+        children = tuple(id(child) for child in mobject.submobjects)
+        for child in set(node.children) - set(children):
+            self.parents.get(child, set()).discard(id(mobject))
+        for child in children:
+            self.parents.setdefault(child, set()).add(id(mobject))
+        node.children = children
+        return value
+
+    def tree_hash(self, scene, mobject):
+        node = self.nodes.get(id(mobject))
+        if node is None or node.mobject is not mobject:
+            node = self.nodes[id(mobject)] = _Node(mobject)
+        if node.tree is not None:
+            self.hits += 1
+            return node.tree
+
+        self.misses += 1
+        if node.own is None:
+            node.own = self.own_hash(scene, node)
+        subtree = [self.tree_hash(scene, child) for child in mobject.submobjects]
+        node.tree = zlib.crc32(repr([node.own] + subtree).encode())
+        return node.tree
+
+    def forget(self, mobject):
+        family = {id(member) for member in mobject.get_family()}
+        for key in family:
+            for parent in self.parents.pop(key, ()):
+                node = self.nodes.get(parent)
+                if parent not in family and node is not None:
+                    # A surviving parent (another root sharing this child)
+                    # rebuilds its links the next time it is hashed
+                    node.own = None
+                    self.invalidate(parent)
+            node = self.nodes.pop(key, None)
+            if node is not None:
+                for child in node.children:
+                    self.parents.get(child, set()).discard(key)
+
+    def mobjects_hash(self, scene, mobjects):
+        self.collect()
+        hashes = [self.tree_hash(scene, mobject) for mobject in mobjects]
+        # Forget mobjects that have left the scene
+        live = {id(mobject): mobject for mobject in mobjects}
+        for key in [key for key in self.roots if key not in live]:
+            self.forget(self.roots.pop(key))
+        self.roots = live
+        return zlib.crc32(repr(hashes).encode())
+
+
+class IncrementalHashScene(Scene):
+    def __init__(self, *args, **kwargs):
+        self.mobject_hash_cache = MobjectHashCache()
+        super().__init__(*args, **kwargs)
+
+    def begin_animations(self):
+        super().begin_animations()
+        # Animations may write into their mobjects' arrays in place
+        for animation in self.animations:
+            if animation.mobject is not None:
+                mark_family_dirty(animation.mobject)
+
+    def get_play_hash(self, camera, animations, mobjects):
+        # Camera and animations are hashed exactly as manim does; only the
+        # scene mobjects go through the cache
+        hashing._Memoizer.mark_as_processed(self)
+        camera_json = hashing.get_json(camera)
+        animations_json = [hashing.get_json(x) for x in sorted(animations, key=str)]
+        hashing._Memoizer.reset_already_processed()
+        hash_camera = zlib.crc32(repr(camera_json).encode())
+        hash_animations = zlib.crc32(repr(animations_json).encode())
+        hash_mobjects = self.mobject_hash_cache.mobjects_hash(self, mobjects)
+        return f"{hash_camera}_{hash_animations}_{hash_mobjects}"
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    if isinstance(scene_object, IncrementalHashScene):
+        return scene_object.get_play_hash(camera_object, animations_list, current_mobjects_list)
+    return hashing.get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list)
+
+
+# Attribute assignment marks the mobject dirty; these edit arrays or the
+# submobject list in place, so they are wrapped as well
+Mobject.__setattr__ = _setattr
+for _cls, _name in [
+    (Mobject, "insert"), (Mobject, "remove"), (Mobject, "sort"),
+    (VMobject, "update_rgbas_array"), (VMobject, "set_anchors_and_handles"), (VGroup, "__setitem__"),
+    (ValueTracker, "set_value"), (ComplexValueTracker, "set_value"),
+]:
+    setattr(_cls, _name, _marks_dirty(getattr(_cls, _name)))
+# These recurse into, or write through, the whole family
+for _cls, _name in [
+    (Mobject, "shuffle"), (Mobject, "invert"), (PMobject, "set_color"), (DecimalNumber, "set_value"),
+]:
+    setattr(_cls, _name, _marks_family_dirty(getattr(_cls, _name)))
+
+# CairoRenderer.play looks the function up in its own module namespace
+cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+pytest.importorskip("manim")
+
+import cost_estimator
+from cost_estimator import DEFAULT_MODEL, FEATURES, calibrate, play_cost
+
+# Synthetic timelines: scene name -> (moving frames, moving points, frozen frames, texts)
+TIMELINES = {
+    "A": (120, 500, 0, 2),
+    "B": (300, 4000, 60, 10),
+    "C": (60, 200, 240, 0),
+    "D": (450, 12000, 30, 25),
+    "E": (200, 800, 120, 6),
+    "F": (90, 6000, 0, 14),
+}
+MEGAPIXELS = 0.4
+
+
+def plays(scene):
+    moving_frames, points, frozen_frames, texts = TIMELINES[scene]
+    return [
+        {"frames": moving_frames, "frozen": False, "moving_points": points, "new_texts": texts},
+        {"frames": frozen_frames, "frozen": True, "moving_points": 0, "new_texts": 0},
+    ]
+
+
+@pytest.fixture
+def timings(tmp_path, monkeypatch):
+    monkeypatch.setattr(cost_estimator, "record_timeline", lambda module, scene, quality: (plays(scene), MEGAPIXELS, 15))
+
+    def write(scenes, model=DEFAULT_MODEL):
+        path = tmp_path / "timings.jsonl"
+        with open(path, "w") as f:
+            for scene in scenes:
+                seconds = model["scene"] + sum(play_cost(play, MEGAPIXELS, model) for play in plays(scene))
+                f.write(json.dumps({"module": "cost_estimator", "scene": scene, "seconds": seconds}) + "\n")
+        return path
+    return write
+
+
+def test_calibrate_recovers_the_model(timings, tmp_path):
+    model = calibrate(timings(TIMELINES), tmp_path / "model.json")
+    for name in FEATURES:
+        assert model[name] == pytest.approx(DEFAULT_MODEL[name], rel=1e-3, abs=1e-9)
+    assert json.loads((tmp_path / "model.json").read_text()) == model
+
+
+def test_calibrate_keeps_costs_non_negative(timings, tmp_path):
+    # Timings that an unconstrained fit explains with a negative text cost
+    model = calibrate(timings(TIMELINES, {**DEFAULT_MODEL, "texts": -0.5}), tmp_path / "model.json")
+    assert all(value >= 0 for value in model.values())
+
+
+def test_calibrate_needs_a_timing_per_coefficient(timings, tmp_path):
+    with pytest.raises(ValueError, match="at least"):
+        calibrate(timings(list(TIMELINES)[:len(FEATURES) - 1]), tmp_path / "model.json")
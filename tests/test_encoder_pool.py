@@ -0,0 +1,76 @@
+import glob
+import shutil
+
+import numpy as np
+import pytest
+
+from encoder_pool import EncoderPool
+
+if shutil.which("sh") is None:
+    pytest.skip("the stand-in encoder is a shell command", allow_module_level=True)
+
+FRAME_SHAPE = (4, 6, 4)
+# Stand-in for ffmpeg: records which encoder process ran it, then copies the raw frames
+ENCODER = ["sh", "-c", 'echo $PPID > "$0.pid"; cat > "$0"']
+
+
+def encode(pool, path, values):
+    pool.open_segment(ENCODER, str(path))
+    for value in values:
+        slot = pool.acquire()
+        pool.arrays[slot][...] = value
+        pool.submit(slot)
+    pool.close_segment()
+
+
+def shared_blocks():
+    return set(glob.glob("/dev/shm/psm_*"))
+
+
+def test_segments_are_encoded_in_parallel(tmp_path):
+    before = shared_blocks()
+    pool = EncoderPool(FRAME_SHAPE, encoders=2, ring_size=3)
+    paths = [tmp_path / f"segment{index}.raw" for index in range(4)]
+    for index, path in enumerate(paths):
+        encode(pool, path, [index, index + 10])
+    pool.join()
+
+    for index, path in enumerate(paths):
+        frames = np.frombuffer(path.read_bytes(), dtype=np.uint8).reshape(-1, *FRAME_SHAPE)
+        assert [frame.max() for frame in frames] == [index, index + 10]
+    # Round-robin: neighbouring segments went to different encoder processes
+    pids = [(tmp_path / f"segment{index}.{index}.part.raw.pid").read_text() for index in range(4)]
+    assert pids[0] == pids[2] != pids[1] == pids[3]
+    assert shared_blocks() <= before
+
+
+def test_repeated_frame_uses_one_slot(tmp_path):
+    pool = EncoderPool(FRAME_SHAPE, encoders=1, ring_size=1)
+    pool.open_segment(ENCODER, str(tmp_path / "still.raw"))
+    slot = pool.acquire()
+    pool.arrays[slot][...] = 7
+    pool.submit(slot, repeat=5)
+    pool.close_segment()
+    pool.join()
+    assert (tmp_path / "still.raw").stat().st_size == 5 * np.prod(FRAME_SHAPE)
+
+
+def test_missing_encoder_fails_on_join(tmp_path):
+    pool = EncoderPool(FRAME_SHAPE, encoders=2, ring_size=2)
+    pool.open_segment([str(tmp_path / "no-such-ffmpeg")], str(tmp_path / "segment.raw"))
+    for _ in range(5):
+        pool.submit(pool.acquire())
+    pool.close_segment()
+    with pytest.raises(RuntimeError, match="failed to encode"):
+        pool.join()
+
+
+def test_dead_encoders_fail_instead_of_hanging(tmp_path):
+    pool = EncoderPool(FRAME_SHAPE, encoders=2, ring_size=2)
+    pool.open_segment(ENCODER, str(tmp_path / "segment.raw"))
+    for worker in pool.workers:
+        worker.kill()
+    with pytest.raises(RuntimeError, match="encoder processes died"):
+        for _ in range(10):
+            pool.submit(pool.acquire())
+    pool.release()
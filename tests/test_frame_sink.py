@@ -0,0 +1,45 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is needed to render", allow_module_level=True)
+
+from manim import Circle, Create, FadeOut, Scene, Square, tempconfig
+
+import encoder_pool
+from frame_sink import SharedMemoryRenderer, renderer_from_env
+
+
+class ThreePlays(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Create(square))
+        self.wait(0.5)
+        self.play(FadeOut(square), Create(Circle()))
+
+
+def test_renders_through_the_encoder_pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLEXUS_ENCODERS", "2")
+    segments = []
+    join = encoder_pool.EncoderPool.join
+
+    def counting_join(pool):
+        segments.append(pool.segments)
+        join(pool)
+
+    monkeypatch.setattr(encoder_pool.EncoderPool, "join", counting_join)
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "progress_bar": "none"}):
+        renderer = renderer_from_env()
+        assert isinstance(renderer, SharedMemoryRenderer)
+        scene = ThreePlays(renderer=renderer)
+        scene.render()
+        writer = scene.renderer.file_writer
+        movie = writer.movie_file_path
+        partial_files = writer.partial_movie_files
+
+    assert segments == [3]
+    assert all(Path(path).exists() for path in partial_files)
+    assert Path(movie).stat().st_size > 0
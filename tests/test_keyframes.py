@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import ManimColor, MoveToTarget, Write
+
+import main_plexus
+from benchmarks.keyframes import CELL_TOLERANCE, GOLDENS_PATH, capture, distance
+from cost_estimator import scene_names
+from locale_catalog import tr
+
+SCENE = "BrachialPlexusConstruction"
+
+
+class SkipPlays:
+    # Drops every play whose animations all match skip()
+    def skip(self, animation):
+        return False
+
+    def play(self, *args, **kwargs):
+        animations = self.compile_animations(*args, **kwargs)
+        if not all(self.skip(animation) for animation in animations):
+            super().play(*animations)
+
+
+class WithoutLateralSweep(SkipPlays):
+    def skip(self, animation):
+        # The lateral cord node and its two edges turning purple
+        target = getattr(animation, "target_mobject", None)
+        return (
+            isinstance(animation, MoveToTarget)
+            and target is not None
+            and ManimColor(target.get_color()) == ManimColor(main_plexus.CORD_COLOR_LATERAL)
+        )
+
+
+class WithoutLateralLabel(SkipPlays):
+    def skip(self, animation):
+        return isinstance(animation, Write) and getattr(animation.mobject, "original_text", None) == tr("cord.lateral")
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return {frame["name"]: frame["signature"] for frame in capture(SCENE)}
+
+
+def test_capture_is_repeatable(baseline):
+    for frame in capture(SCENE):
+        assert distance(baseline[frame["name"]], frame["signature"]) <= CELL_TOLERANCE, frame["name"]
+
+
+@pytest.mark.parametrize("mixin", [WithoutLateralSweep, WithoutLateralLabel])
+def test_missing_play_is_caught(baseline, mixin):
+    frames = {frame["name"]: frame["signature"] for frame in capture(SCENE, mixins=(mixin,))}
+    assert distance(baseline["roots"], frames["roots"]) <= CELL_TOLERANCE
+    assert distance(baseline["cords_colored"], frames["cords_colored"]) > CELL_TOLERANCE
+
+
+@pytest.mark.parametrize("scene_name", scene_names(main_plexus))
+def test_matches_goldens(scene_name):
+    # Fails, rather than skips, until goldens are recorded with keyframes.py --update
+    assert GOLDENS_PATH.exists(), f"no goldens in {GOLDENS_PATH}"
+    goldens = json.loads(GOLDENS_PATH.read_text())
+    for frame in capture(scene_name):
+        key = f"{scene_name}:{frame['name']}"
+        assert key in goldens, f"no golden for {key}"
+        assert distance(goldens[key], frame["signature"]) <= CELL_TOLERANCE, key
@@ -0,0 +1,44 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is needed to render", allow_module_level=True)
+
+from manim import tempconfig
+
+import locale_catalog
+import main_plexus
+from locale_batch import render_locales
+
+
+@pytest.fixture
+def locales(tmp_path, monkeypatch):
+    # "xx" is English with every string lengthened, so all text geometry differs
+    english = json.loads((Path(locale_catalog.LOCALE_DIR) / "en.json").read_text(encoding="utf-8"))
+    catalog_dir = tmp_path / "locales"
+    catalog_dir.mkdir()
+    (catalog_dir / "en.json").write_text(json.dumps(english), encoding="utf-8")
+    (catalog_dir / "xx.json").write_text(json.dumps({key: f"{text} ~" for key, text in english.items()}), encoding="utf-8")
+    monkeypatch.setattr(locale_catalog, "LOCALE_DIR", str(catalog_dir))
+    monkeypatch.setattr(locale_catalog, "_catalogs", {})
+    return ["en", "xx"]
+
+
+def last_frame(path):
+    command = ["ffmpeg", "-loglevel", "error", "-sseof", "-0.5", "-i", path, "-frames:v", "1", "-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+    return subprocess.run(command, check=True, capture_output=True).stdout
+
+
+def test_second_locale_reuses_text_free_segments(locales, tmp_path):
+    with tempconfig({"media_dir": str(tmp_path / "media")}):
+        outputs = render_locales(main_plexus, "BrachialPlexusConstruction", locales)
+    assert outputs["xx"]["base_plays"] > 0
+    assert outputs["xx"]["cache_hits"] >= outputs["xx"]["base_plays"]
+    # The shared segments still end up with each locale's own text on top
+    assert last_frame(outputs["en"]["path"]) != last_frame(outputs["xx"]["path"])
+
@@ -0,0 +1,17 @@
+import locale_catalog
+
+
+def test_shipped_catalogs_cover_english():
+    english = set(locale_catalog.load("en"))
+    assert len(locale_catalog.available_locales()) > 1
+    for locale in locale_catalog.available_locales():
+        assert set(locale_catalog.load(locale)) == english, locale
+
+
+def test_missing_key_falls_back_to_english(tmp_path, monkeypatch):
+    (tmp_path / "en.json").write_text('{"title": "Title", "cord": "Cord"}', encoding="utf-8")
+    (tmp_path / "de.json").write_text('{"title": "Titel"}', encoding="utf-8")
+    monkeypatch.setattr(locale_catalog, "LOCALE_DIR", str(tmp_path))
+    monkeypatch.setattr(locale_catalog, "_catalogs", {})
+    assert locale_catalog.tr("title", "de") == "Titel"
+    assert locale_catalog.tr("cord", "de") == "Cord"
@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip("manim")
+
+from cost_estimator import DEFAULT_MODEL
+from preview import LADDER, POLICIES, join, plan, predict
+
+
+def timeline(plays=10, waits=10):
+    # Long moving plays and long frozen waits, so the caps matter
+    play = {"kind": "play", "duration": 5.0, "frozen": False, "moving_points": 2000, "new_texts": 1}
+    wait = {"kind": "wait", "duration": 3.0, "frozen": True, "moving_points": 0, "new_texts": 0}
+    return {"Scene": [dict(play) for _ in range(plays)] + [dict(wait) for _ in range(waits)]}
+
+
+def test_plan_tightens_caps_before_resolution():
+    timelines = timeline()
+    budget = predict(timelines, POLICIES[-1], LADDER[0], DEFAULT_MODEL)
+    assert predict(timelines, POLICIES[0], LADDER[0], DEFAULT_MODEL) > budget
+
+    policy, rung, cost = plan(timelines, budget, DEFAULT_MODEL)
+    assert rung == LADDER[0]
+    assert cost <= budget
+
+
+def test_plan_keeps_full_settings_when_they_fit():
+    timelines = timeline()
+    budget = predict(timelines, POLICIES[0], LADDER[0], DEFAULT_MODEL)
+    assert plan(timelines, budget, DEFAULT_MODEL)[:2] == (POLICIES[0], LADDER[0])
+
+
+def test_plan_falls_back_to_cheapest_over_budget():
+    policy, rung, _ = plan(timeline(), 0.0, DEFAULT_MODEL)
+    assert (policy, rung) == (POLICIES[-1], LADDER[-1])
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None, reason="needs ffmpeg")
+def test_join_concatenates_scene_movies(tmp_path):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"scene {index}.mp4"
+        subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i", "testsrc=duration=1:size=64x36:rate=10",
+             "-pix_fmt", "yuv420p", str(path)],
+            check=True,
+        )
+        paths.append(path)
+
+    output = join(paths, tmp_path / "preview.mp4")
+    probe = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(output)],
+        check=True, capture_output=True, text=True,
+    )
+    assert float(probe.stdout) == pytest.approx(2.0, abs=0.2)
+    assert not output.with_suffix(".txt").exists()
@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import BLUE, RED, Circle, Dot, Line, Square, ValueTracker, VGroup, VMobject
+
+from scene_hashing import IncrementalHashScene
+
+
+@pytest.fixture
+def scene():
+    return IncrementalHashScene()
+
+
+def play_hash(scene, mobjects):
+    return scene.get_play_hash(scene.renderer.camera, [], mobjects)
+
+
+def test_mutating_a_child_changes_the_play_hash(scene):
+    child = Circle()
+    graph = VGroup(Square(), VGroup(child))
+    before = play_hash(scene, [graph])
+    assert play_hash(scene, [graph]) == before
+    child.set_color(RED)
+    after = play_hash(scene, [graph])
+    assert after != before
+    child.set_color(BLUE)
+    assert play_hash(scene, [graph]) not in (before, after)
+
+
+def test_child_shared_with_a_removed_root_stays_tracked(scene):
+    child = Dot()
+    graph = VGroup(Square(), child)
+    play_hash(scene, [graph, VGroup(child)])
+    play_hash(scene, [graph])
+    child.set_color(RED)
+    first = play_hash(scene, [graph])
+    child.set_color(BLUE)
+    assert play_hash(scene, [graph]) != first
+
+
+def test_in_place_mutators_change_the_play_hash(scene):
+    path = VMobject()
+    path.set_points_as_corners([[-1, 0, 0], [0, 1, 0], [1, 0, 0]])
+    tracker = ValueTracker(1)
+    edges = VGroup(Line(), Square())
+    mobjects = [path, tracker, edges]
+
+    for mutate in (path.make_smooth, lambda: tracker.set_value(2), edges.invert):
+        before = play_hash(scene, mobjects)
+        mutate()
+        assert play_hash(scene, mobjects) != before